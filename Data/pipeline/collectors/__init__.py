@@ -1,16 +1,34 @@
 """
 Collectors package with all available collectors
+
+Collectors are imported lazily (PEP 562), so importing one submodule such
+as ``pipeline.collectors.base_collector`` does not pull in every other
+collector and its HTTP/parsing dependencies.
 """
 
-from .base_collector import BaseCollector, CollectorRecord
-from .arxiv_collector import ArxivCollector
-from .biorxiv_collector import BiorxivCollector
-from .alphafold_collector import AlphaFoldCollector
-
-__all__ = [
-    "BaseCollector",
-    "CollectorRecord",
-    "ArxivCollector",
-    "BiorxivCollector",
-    "AlphaFoldCollector",
-]
+import importlib
+
+_LAZY = {
+    "BaseCollector": (".base_collector", "BaseCollector"),
+    "CollectorRecord": (".base_collector", "CollectorRecord"),
+    "ArxivCollector": (".arxiv_collector", "ArxivCollector"),
+    "BiorxivCollector": (".biorxiv_collector", "BiorxivCollector"),
+    "AlphaFoldCollector": (".alphafold_collector", "AlphaFoldCollector"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the requested collector on first access"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,15 +4,59 @@ Fetches protein structure predictions from AlphaFold EBI API
 API Documentation: https://alphafold.ebi.ac.uk/api-docs
 """
 
+import asyncio
+import gzip
+import json
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from .base_collector import BaseCollector, CollectorRecord
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
+from .base_collector import BaseCollector, CollectorRecord, create_http_session, parse_json
 from ..config import get_config
 from ..logger import get_logger
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 lets concurrent requests share one TLS connection to EBI; it
+# needs the optional h2 package (httpx[http2])
+_HTTP2 = find_spec("h2") is not None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 logger = get_logger(__name__)
 
+# Markdown skeleton of a record's raw_content; optional sections are
+# rendered separately and substituted as whole fragments
+_SUMMARY_TEMPLATE = (
+    "# AlphaFold Structure Prediction\n"
+    "\n## Protein Information\n"
+    "- **UniProt ID**: {uniprot_id}\n"
+    "- **Protein Name**: {protein_name}"
+    "{uniprot_section}\n"
+    "\n## Structure Models"
+    "{models_section}"
+    "{experimental_section}\n"
+    "\n## Source\n"
+    "- **Database**: AlphaFold Protein Structure Database\n"
+    "- **Entry URL**: https://alphafold.ebi.ac.uk/entry/{uniprot_id}"
+)
+
+
+def _section(lines: List[str]) -> str:
+    """Render optional summary lines as a fragment for _SUMMARY_TEMPLATE"""
+    return "\n" + "\n".join(lines) if lines else ""
+
 
 class AlphaFoldCollector(BaseCollector):
     """Collect protein structures from AlphaFold database"""
@@ -27,13 +71,41 @@ class AlphaFoldCollector(BaseCollector):
         "annotations": "/annotations/{uniprot_id}.json",  # Get annotations
     }
     
-    def __init__(self, max_results: int = 100, batch_size: int = 10):
+    # Concurrent requests in flight against the EBI server (async path)
+    MAX_CONCURRENCY = 16
+    
+    # Transient statuses retried with backoff, as by create_http_session
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BACKOFF = 0.3
+    
+    # How long cached API responses are used without revalidating (seconds);
+    # older entries are revalidated with If-None-Match against their ETag
+    CACHE_TTL = 86400
+    
+    # Entries without an ETag can't be revalidated; they are dropped after
+    # this many TTLs (and meanwhile still serve as a fallback when a refetch fails)
+    CACHE_EXPIRE_TTLS = 7
+    
+    # Annotations kept inline in metadata when the full set goes to disk
+    ANNOTATION_SAMPLE_SIZE = 5
+    
+    def __init__(
+        self,
+        max_results: int = 100,
+        batch_size: int = 10,
+        cache_dir: Optional[str] = ".cache/alphafold",
+        annotations_dir: Optional[str] = "data/alphafold"
+    ):
         """
         Initialize AlphaFold collector
         
         Args:
             max_results: Maximum number of proteins to fetch
             batch_size: Number of proteins to process in batch
+            cache_dir: Directory for the on-disk response cache, or None
+                to disable it (also disabled if diskcache is not installed)
+            annotations_dir: Directory for gzipped annotation sidecar files,
+                or None to keep full annotations inline in metadata
         """
         super().__init__("alphafold_structures")
         self.max_results = max_results
@@ -41,6 +113,13 @@ class AlphaFoldCollector(BaseCollector):
         config = get_config()
         self.timeout = config.collector.request_timeout
         self.max_retries = config.collector.max_retries
+        self.session = create_http_session(self.max_retries)
+        self.annotations_dir = Path(annotations_dir) if annotations_dir else None
+        # Full URL template per endpoint, so a fetch is a single format()
+        self._url_templates = {
+            name: self.API_BASE_URL + path for name, path in self.ENDPOINTS.items()
+        }
+        self._cache = diskcache.Cache(cache_dir) if diskcache is not None and cache_dir else None
     
     def collect(
         self,
@@ -65,71 +144,304 @@ class AlphaFoldCollector(BaseCollector):
         # Limit to max_results
         uniprot_ids = uniprot_ids[:self.max_results]
         
-        for i, uniprot_id in enumerate(uniprot_ids):
-            try:
-                logger.debug(f"Collecting AlphaFold data for {uniprot_id} ({i+1}/{len(uniprot_ids)})")
-                
-                # Get prediction data (main data)
-                prediction_data = self._fetch_prediction(uniprot_id)
+        # Fetch every endpoint for every ID concurrently when httpx is
+        # available; otherwise fall back to requests, one ID at a time
+        prefetched = None
+        if self._can_run_async():
+            prefetched = asyncio.run(
+                self._afetch_all(uniprot_ids, include_summary, include_annotations)
+            )
+        
+        # Records in input order; validated together once collected
+        collected = []
+        
+        # Fallback path: the endpoints of one ID are fetched in
+        # parallel (threads are only started on first submit)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for i, uniprot_id in enumerate(uniprot_ids):
+                try:
+                    logger.debug(f"Collecting AlphaFold data for {uniprot_id} ({i+1}/{len(uniprot_ids)})")
                 
-                if not prediction_data:
-                    logger.warning(f"No prediction data found for {uniprot_id}")
-                    continue
+                    if prefetched is not None:
+                        fetched = prefetched[i]
+                        for result in fetched:
+                            if isinstance(result, BaseException):
+                                raise result
+                    else:
+                        fetched = self._fetch_entry(
+                            uniprot_id, include_summary, include_annotations, executor
+                        )
+                    prediction_data, summary_data, annotations_data = fetched
                 
-                # Get additional data
-                summary_data = None
-                annotations_data = None
+                    if not prediction_data:
+                        logger.warning(f"No prediction data found for {uniprot_id}")
+                        continue
                 
-                if include_summary:
-                    summary_data = self._fetch_uniprot_summary(uniprot_id)
+                    # Create record
+                    record = self._create_record(
+                        uniprot_id,
+                        prediction_data,
+                        summary_data,
+                        annotations_data
+                    )
                 
-                if include_annotations:
-                    annotations_data = self._fetch_annotations(uniprot_id)
+                    collected.append(record)
                 
-                # Create record
-                record = self._create_record(
-                    uniprot_id,
-                    prediction_data,
-                    summary_data,
-                    annotations_data
-                )
-                
-                self.add_record(record)
-                
-            except Exception as e:
-                logger.warning(f"Failed to collect AlphaFold data for {uniprot_id}: {e}")
-                record = CollectorRecord(
-                    data_type="structure",
-                    source="alphafold",
-                    collection="alphafold_structures",
-                    title=f"AlphaFold structure - {uniprot_id}",
-                    error=str(e),
-                    metadata={"uniprot_id": uniprot_id}
-                )
-                self.records.append(record)
-        
+                except Exception as e:
+                    logger.warning(f"Failed to collect AlphaFold data for {uniprot_id}: {e}")
+                    record = CollectorRecord(
+                        data_type="structure",
+                        source="alphafold",
+                        collection="alphafold_structures",
+                        title=f"AlphaFold structure - {uniprot_id}",
+                        error=str(e),
+                        metadata={"uniprot_id": uniprot_id}
+                    )
+                    collected.append(record)
+        
+        self.add_records(collected)
         logger.info(f"Successfully collected {len(self.get_valid_records())} AlphaFold structures")
         return self.records
     
-    def _fetch_prediction(self, uniprot_id: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _can_run_async() -> bool:
+        """Whether collect() can drive its own event loop with httpx"""
+        if httpx is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        # Already inside a running loop; asyncio.run() would fail
+        return False
+    
+    def _url(self, endpoint: str, uniprot_id: str) -> str:
+        """Build the API URL of an endpoint for a UniProt ID"""
+        return self._url_templates[endpoint].format(uniprot_id=uniprot_id)
+    
+    def _fetch_entry(
+        self,
+        uniprot_id: str,
+        include_summary: bool,
+        include_annotations: bool,
+        executor: ThreadPoolExecutor
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
         """
-        Fetch prediction data for a UniProt ID
+        Fetch prediction, summary and annotations for one UniProt ID
+        
+        The requests are independent, so they are submitted together;
+        summary and annotations are dropped when there is no prediction.
+        
+        Returns:
+            (prediction_data, summary_data, annotations_data)
+        """
+        prediction = executor.submit(self._fetch_prediction, uniprot_id)
+        summary = executor.submit(self._fetch_uniprot_summary, uniprot_id) if include_summary else None
+        annotations = executor.submit(self._fetch_annotations, uniprot_id) if include_annotations else None
+        
+        prediction_data = prediction.result()
+        if not prediction_data:
+            return None, None, None
+        
+        summary_data = summary.result() if summary else None
+        annotations_data = annotations.result() if annotations else None
+        return prediction_data, summary_data, annotations_data
+    
+    async def _afetch_all(
+        self,
+        uniprot_ids: List[str],
+        include_summary: bool,
+        include_annotations: bool
+    ) -> List[Tuple[Any, Any, Any]]:
+        """
+        Fetch all endpoints for all UniProt IDs concurrently
+        
+        Returns:
+            One (prediction, summary, annotations) tuple per ID, in order.
+            Failed requests give None; unexpected errors are returned as
+            exception objects for collect() to record.
+        """
+        endpoints = ["prediction"]
+        if include_summary:
+            endpoints.append("uniprot_summary")
+        if include_annotations:
+            endpoints.append("annotations")
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        keys = [(endpoint, uniprot_id) for uniprot_id in uniprot_ids for endpoint in endpoints]
+        entries = [self._cache_get(key) for key in keys]
+        results = [entry[0] if self._is_fresh(entry) else None for entry in entries]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if missing:
+            # The client belongs to this event loop, so it lives per call.
+            # httpx already negotiates gzip/deflate (and br when available)
+            async with httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=self.timeout,
+                headers={"Accept": "application/json"}
+            ) as client:
+                responses = await asyncio.gather(
+                    *(
+                        self._afetch(client, semaphore, self._url(*keys[i]), entries[i])
+                        for i in missing
+                    ),
+                    return_exceptions=True
+                )
+            for i, response in zip(missing, responses):
+                if isinstance(response, BaseException):
+                    results[i] = response
+                    continue
+                results[i], etag = response
+                if results[i] is None and entries[i] is not None:
+                    # Refetch failed: serve the stale entry, keep its timestamp
+                    results[i] = entries[i][0]
+                    continue
+                self._cache_set(keys[i], results[i], etag)
+        
+        fetched = []
+        width = len(endpoints)
+        for i in range(len(uniprot_ids)):
+            by_endpoint = dict(zip(endpoints, results[i * width:(i + 1) * width]))
+            fetched.append((
+                by_endpoint["prediction"],
+                by_endpoint.get("uniprot_summary"),
+                by_endpoint.get("annotations"),
+            ))
+        return fetched
+    
+    async def _afetch(
+        self,
+        client,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        cached: Optional[Tuple[Any, Optional[str], float]] = None
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Fetch one JSON document, revalidating a stale cache entry
+        
+        Args:
+            client: httpx.AsyncClient
+            semaphore: Bounds the number of requests in flight
+            url: URL to fetch
+            cached: Stale cache entry to revalidate, if any
+        
+        429/5xx responses and transport errors are retried up to
+        max_retries times with exponential backoff, honouring Retry-After,
+        like the retrying session of the sync path.
+        
+        Returns:
+            (data, etag); data is None if the request failed
+        """
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            # The semaphore is released while backing off
+            async with semaphore:
+                try:
+                    response = await client.get(url, headers=self._conditional_headers(cached))
+                    if response.status_code == 304 and cached is not None:
+                        return cached[0], cached[1]
+                    if response.status_code in self.RETRY_STATUSES and attempt < self.max_retries:
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        response.raise_for_status()
+                        return parse_json(response.content), response.headers.get("ETag")
+                except httpx.TransportError as e:
+                    if attempt >= self.max_retries:
+                        logger.debug(f"Failed to fetch {url}: {e}")
+                        return None, None
+                except (httpx.HTTPError, ValueError) as e:
+                    # ValueError covers bad JSON, as on the sync path
+                    logger.debug(f"Failed to fetch {url}: {e}")
+                    return None, None
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+        return None, None
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff before retry number attempt + 1, at least the server's Retry-After"""
+        delay = self.RETRY_BACKOFF * (2 ** attempt)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                try:
+                    delay = max(delay, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return delay
+    
+    def _fetch_json(self, endpoint: str, uniprot_id: str) -> Optional[Any]:
+        """
+        Fetch one endpoint for a UniProt ID, going through the disk cache
         
         Args:
+            endpoint: Key into ENDPOINTS
             uniprot_id: UniProt accession ID
         
         Returns:
-            Prediction data or None if failed
+            Parsed JSON; a stale cached copy, or None, if the request failed
         """
-        url = self.API_BASE_URL + self.ENDPOINTS["prediction"].format(uniprot_id=uniprot_id)
+        key = (endpoint, uniprot_id)
+        cached = self._cache_get(key)
+        if self._is_fresh(cached):
+            return cached[0]
         
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Failed to fetch prediction for {uniprot_id}: {e}")
+            response = self.session.get(
+                self._url(endpoint, uniprot_id),
+                headers=self._conditional_headers(cached),
+                timeout=self.timeout
+            )
+            if response.status_code == 304 and cached is not None:
+                data, etag = cached[0], cached[1]
+            else:
+                response.raise_for_status()
+                data, etag = parse_json(response.content), response.headers.get("ETag")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f"Failed to fetch {endpoint} for {uniprot_id}: {e}")
+            # A stale entry beats no data
+            return cached[0] if cached is not None else None
+        
+        self._cache_set(key, data, etag)
+        return data
+    
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[Tuple[Any, Optional[str], float]]:
+        """Cached (data, etag, stored_at) for (endpoint, uniprot_id), or None"""
+        if self._cache is None:
             return None
+        entry = self._cache.get(key)
+        # Anything else is a leftover from an older cache layout
+        return entry if isinstance(entry, tuple) and len(entry) == 3 else None
+    
+    def _cache_set(self, key: Tuple[str, str], data: Optional[Any], etag: Optional[str] = None) -> None:
+        """Cache a successful response; failures are retried next time"""
+        if self._cache is not None and data is not None:
+            expire = None if etag else self.CACHE_TTL * self.CACHE_EXPIRE_TTLS
+            self._cache.set(key, (data, etag, time.time()), expire=expire)
+    
+    def _is_fresh(self, entry: Optional[Tuple[Any, Optional[str], float]]) -> bool:
+        """Whether a cache entry can be used without revalidating it"""
+        return entry is not None and time.time() - entry[2] < self.CACHE_TTL
+    
+    @staticmethod
+    def _conditional_headers(entry: Optional[Tuple[Any, Optional[str], float]]) -> Optional[Dict[str, str]]:
+        """If-None-Match header for revalidating a stale entry, if it has an ETag"""
+        if entry is not None and entry[1]:
+            return {"If-None-Match": entry[1]}
+        return None
+    
+    def _fetch_prediction(self, uniprot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch prediction data for a UniProt ID
+        
+        Args:
+            uniprot_id: UniProt accession ID
+        
+        Returns:
+            Prediction data or None if failed
+        """
+        return self._fetch_json("prediction", uniprot_id)
     
     def _fetch_uniprot_summary(self, uniprot_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -141,15 +453,7 @@ class AlphaFoldCollector(BaseCollector):
         Returns:
             Summary data or None if failed
         """
-        url = self.API_BASE_URL + self.ENDPOINTS["uniprot_summary"].format(uniprot_id=uniprot_id)
-        
-        try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Failed to fetch summary for {uniprot_id}: {e}")
-            return None
+        return self._fetch_json("uniprot_summary", uniprot_id)
     
     def _fetch_annotations(self, uniprot_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -161,15 +465,7 @@ class AlphaFoldCollector(BaseCollector):
         Returns:
             Annotations data or None if failed
         """
-        url = self.API_BASE_URL + self.ENDPOINTS["annotations"].format(uniprot_id=uniprot_id)
-        
-        try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Failed to fetch annotations for {uniprot_id}: {e}")
-            return None
+        return self._fetch_json("annotations", uniprot_id)
     
     def _create_record(
         self,
@@ -244,6 +540,12 @@ class AlphaFoldCollector(BaseCollector):
             "pae_scores": pae_scores if pae_scores else None,
         }
         
+        # Aggregate pLDDT once here so the summary only formats it
+        if pld_scores:
+            plddt = np.asarray(pld_scores, dtype=np.float64)
+            metadata["models"]["avg_plddt"] = float(plddt.mean())
+            metadata["models"]["std_plddt"] = float(plddt.std())
+        
         # Add summary information
         if summary_data:
             if "uniprotEntry" in summary_data:
@@ -265,10 +567,7 @@ class AlphaFoldCollector(BaseCollector):
         
         # Add annotations
         if annotations_data:
-            metadata["annotations"] = {
-                "count": len(annotations_data) if isinstance(annotations_data, list) else 0,
-                "data": annotations_data
-            }
+            metadata["annotations"] = self._summarize_annotations(uniprot_id, annotations_data)
         
         # Build raw content (human-readable summary)
         raw_content = self._build_content_summary(
@@ -291,6 +590,37 @@ class AlphaFoldCollector(BaseCollector):
         
         return record
     
+    def _summarize_annotations(self, uniprot_id: str, annotations_data: Any) -> Dict[str, Any]:
+        """
+        Annotation metadata for a record
+        
+        The full annotations go to a gzipped JSON sidecar file and only
+        the count, a short sample and the file path stay in metadata, so
+        records don't carry the whole blob through the pipeline.
+        
+        Args:
+            uniprot_id: UniProt accession ID
+            annotations_data: Annotations from the API
+        
+        Returns:
+            Annotations metadata dictionary
+        """
+        count = len(annotations_data) if isinstance(annotations_data, list) else 0
+        if self.annotations_dir is None:
+            return {"count": count, "data": annotations_data}
+        
+        path = self.annotations_dir / f"{uniprot_id}.annotations.json.gz"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                json.dump(annotations_data, f)
+        except OSError as e:
+            logger.warning(f"Failed to write annotations for {uniprot_id}: {e}")
+            return {"count": count, "data": annotations_data}
+        
+        sample = annotations_data[:self.ANNOTATION_SAMPLE_SIZE] if isinstance(annotations_data, list) else []
+        return {"count": count, "sample": sample, "path": str(path)}
+    
     def _build_content_summary(
         self,
         uniprot_id: str,
@@ -308,56 +638,69 @@ class AlphaFoldCollector(BaseCollector):
         Returns:
             Content summary as string
         """
-        content = []
-        content.append(f"# AlphaFold Structure Prediction")
-        content.append(f"\n## Protein Information")
-        content.append(f"- **UniProt ID**: {uniprot_id}")
-        content.append(f"- **Protein Name**: {protein_name}")
-        
+        uniprot_lines = []
         if "uniprot" in metadata:
             up = metadata["uniprot"]
-            content.append(f"- **Sequence Length**: {up.get('sequence_length', 'N/A')} amino acids")
+            uniprot_lines.append(f"- **Sequence Length**: {up.get('sequence_length', 'N/A')} amino acids")
             
             if up.get("organism"):
                 organism = up["organism"]
-                content.append(f"- **Organism**: {organism.get('scientificName', organism.get('commonName', 'N/A'))}")
+                uniprot_lines.append(f"- **Organism**: {organism.get('scientificName', organism.get('commonName', 'N/A'))}")
             
             if up.get("function"):
-                content.append(f"- **Function**: {up['function']}")
+                uniprot_lines.append(f"- **Function**: {up['function']}")
             
             if up.get("cellular_location"):
-                content.append(f"- **Cellular Location**: {up['cellular_location']}")
+                uniprot_lines.append(f"- **Cellular Location**: {up['cellular_location']}")
         
-        content.append(f"\n## Structure Models")
+        model_lines = []
         if "models" in metadata:
             models_info = metadata["models"]
-            content.append(f"- **Number of Models**: {models_info.get('count', 0)}")
+            model_lines.append(f"- **Number of Models**: {models_info.get('count', 0)}")
             
             if models_info.get("plddt_scores"):
-                avg_plddt = sum(models_info["plddt_scores"]) / len(models_info["plddt_scores"])
-                content.append(f"- **Average pLDDT Score**: {avg_plddt:.2f}")
-                content.append(f"- **pLDDT Scores**: {models_info['plddt_scores']}")
+                model_lines.append(f"- **Average pLDDT Score**: {models_info['avg_plddt']:.2f}")
+                model_lines.append(f"- **pLDDT Scores**: {models_info['plddt_scores']}")
             
             if models_info.get("model_files"):
-                content.append(f"\n### Model Files")
+                model_lines.append("\n### Model Files")
                 for model in models_info["model_files"]:
-                    content.append(f"  - **{model.get('model_id')}**:")
-                    urls = model.get("urls", {})
-                    for fmt, url in urls.items():
+                    model_lines.append(f"  - **{model.get('model_id')}**:")
+                    for fmt, url in model.get("urls", {}).items():
                         if url:
-                            content.append(f"    - {fmt.upper()}: {url}")
+                            model_lines.append(f"    - {fmt.upper()}: {url}")
+        
+        experimental_lines = []
+        if metadata.get("experimental_structures"):
+            experimental_lines.append("\n## Experimental Structures")
+            experimental_lines.append(f"- **Count**: {len(metadata['experimental_structures'])}")
+        
+        return _SUMMARY_TEMPLATE.format_map({
+            "uniprot_id": uniprot_id,
+            "protein_name": protein_name,
+            "uniprot_section": _section(uniprot_lines),
+            "models_section": _section(model_lines),
+            "experimental_section": _section(experimental_lines),
+        })
+    
+    def validate_batch(self, records: List[CollectorRecord]) -> List[bool]:
+        """
+        Validate many AlphaFold records at once
         
-        if "experimental_structures" in metadata:
-            exp_structs = metadata["experimental_structures"]
-            if exp_structs:
-                content.append(f"\n## Experimental Structures")
-                content.append(f"- **Count**: {len(exp_structs)}")
+        Same checks as validate(), over the metadata of all records in
+        one pass.
         
-        content.append(f"\n## Source")
-        content.append(f"- **Database**: AlphaFold Protein Structure Database")
-        content.append(f"- **Entry URL**: https://alphafold.ebi.ac.uk/entry/{uniprot_id}")
+        Args:
+            records: Records to validate
         
-        return "\n".join(content)
+        Returns:
+            One flag per record, True if valid
+        """
+        return [
+            bool(m) and "uniprot_id" in m and "models" in m
+            and m["models"].get("count", 0) != 0
+            for m in (r.metadata for r in records)
+        ]
     
     def validate(self, record: CollectorRecord) -> bool:
         """
@@ -6,9 +6,62 @@ All collectors inherit from this
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
+import json
 import uuid
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(content: bytes) -> Any:
+    """
+    Parse a JSON response body, with orjson when it is installed
+    
+    Raises:
+        ValueError: If content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def create_http_session(max_retries: int, pool_size: int = 32) -> requests.Session:
+    """
+    Create a keep-alive HTTP session for a collector
+    
+    Connections are pooled and reused across requests, and transient
+    failures (429/5xx, connection errors) are retried with backoff.
+    Responses are requested as compressed JSON.
+    
+    Args:
+        max_retries: Maximum number of retries per request
+        pool_size: Connections kept open per host
+    
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept"] = "application/json"
+    # Only advertises br/zstd when a decoder for them is installed
+    session.headers.update(make_headers(accept_encoding=True))
+    return session
+
 
 @dataclass
 class CollectorRecord:
@@ -89,6 +142,33 @@ class BaseCollector(ABC):
             record.error = "Validation failed"
             self.records.append(record)
     
+    def validate_batch(self, records: List[CollectorRecord]) -> Sequence[bool]:
+        """
+        Validate many records at once
+        
+        Calls validate() per record; collectors can override this with a
+        cheaper bulk check.
+        
+        Args:
+            records: Records to validate
+        
+        Returns:
+            One flag per record, True if valid
+        """
+        return [self.validate(record) for record in records]
+    
+    def add_records(self, records: List[CollectorRecord]) -> None:
+        """
+        Add many records, validating them with one validate_batch() call
+        
+        Records that already carry an error are added as they are.
+        """
+        pending = [r for r in records if r.error is None]
+        for record, valid in zip(pending, self.validate_batch(pending)):
+            if not valid:
+                record.error = "Validation failed"
+        self.records.extend(records)
+    
     def get_valid_records(self) -> List[CollectorRecord]:
         """Get all valid (non-error) records"""
         return [r for r in self.records if r.error is None]
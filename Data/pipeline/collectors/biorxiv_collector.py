@@ -3,10 +3,10 @@ BioRxiv preprint collector
 Fetches preprints from bioRxiv API
 """
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
-from .base_collector import BaseCollector, CollectorRecord
+from typing import List, Optional
+from .base_collector import BaseCollector, CollectorRecord, create_http_session, parse_json
 from ..config import get_config
 from ..logger import get_logger
 
@@ -29,6 +29,7 @@ class BiorxivCollector(BaseCollector):
         self.api_url = config.biorxiv_api_url
         self.timeout = config.request_timeout
         self.max_retries = config.max_retries
+        self.session = create_http_session(self.max_retries)
     
     def collect(
         self,
@@ -55,26 +56,32 @@ class BiorxivCollector(BaseCollector):
         # BioRxiv uses different endpoint for search
         url = f"{self.api_url}/search"
         
+        limit = min(limit, self.max_results)
         params = {
             "query": query,
-            "limit": min(limit, self.max_results),
+            "limit": limit,
             "sort": sort_by,
             "direction": direction
         }
         
         try:
-            response = requests.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._fetch_page(url, params)
             
             # BioRxiv returns results in 'results' key
             results = data.get("results", [])
             
+            # Fetch any further pages concurrently
+            offsets = self._remaining_offsets(data, len(results), limit)
+            if offsets:
+                with ThreadPoolExecutor(max_workers=min(len(offsets), 8)) as executor:
+                    pages = executor.map(
+                        lambda offset: self._fetch_more(url, {**params, "offset": offset}),
+                        offsets
+                    )
+                    for page in pages:
+                        results.extend(page)
+                results = results[:limit]
+            
             for item in results:
                 try:
                     record = self._parse_item(item)
@@ -89,6 +96,46 @@ class BiorxivCollector(BaseCollector):
         
         return self.records
     
+    def _fetch_page(self, url: str, params: dict) -> dict:
+        """Fetch and decode one page of search results"""
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return parse_json(response.content)
+    
+    def _fetch_more(self, url: str, params: dict) -> List[dict]:
+        """Results of a follow-up page, or an empty list if it failed"""
+        try:
+            return self._fetch_page(url, params).get("results", [])
+        except Exception as e:
+            logger.warning(f"Failed to fetch BioRxiv page at offset {params.get('offset')}: {e}")
+            return []
+    
+    @staticmethod
+    def _remaining_offsets(data: dict, page_size: int, limit: int) -> List[int]:
+        """
+        Offsets of the pages still needed to reach limit
+        
+        Only paginates when the response reports a total hit count, either
+        as BioRxiv's messages[0]["total"] or a top-level "total".
+        """
+        total = BiorxivCollector._total_results(data)
+        if total is None or page_size == 0:
+            return []
+        return list(range(page_size, min(limit, total), page_size))
+    
+    @staticmethod
+    def _total_results(data: dict) -> Optional[int]:
+        """Total number of hits reported by the API, if any"""
+        messages = data.get("messages")
+        if isinstance(messages, list) and messages and isinstance(messages[0], dict):
+            total = messages[0].get("total")
+        else:
+            total = data.get("total")
+        try:
+            return int(total) if total is not None else None
+        except (TypeError, ValueError):
+            return None
+    
     def _parse_item(self, item: dict) -> CollectorRecord:
         """Parse a single BioRxiv item"""
         title = item.get("title", "Unknown")
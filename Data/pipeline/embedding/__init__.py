@@ -1,34 +1,38 @@
 """
 Embedding package with specialized embedders
+
+Embedders are imported lazily (PEP 562), so ``import pipeline.embedding``
+does not load torch, CLIP or ESM until an embedder is actually used.
+An embedder whose dependencies are missing resolves to None.
 """
 
+import importlib
+
 from .base_embedder import BaseEmbedder
 
-# Import proper embedders
-try:
-    from .text_embedder import SentenceTransformerTextEmbedder
-except ImportError:
-    SentenceTransformerTextEmbedder = None
-
-try:
-    from .image_embedder import CLIPImageEmbedder
-except ImportError:
-    CLIPImageEmbedder = None
-
-try:
-    from .sequence_embedder import ESMSequenceEmbedder
-except ImportError:
-    ESMSequenceEmbedder = None
-
-try:
-    from .structure_embedder import StructureEmbedder
-except ImportError:
-    StructureEmbedder = None
-
-__all__ = [
-    "BaseEmbedder",
-    "SentenceTransformerTextEmbedder",
-    "CLIPImageEmbedder",
-    "ESMSequenceEmbedder",
-    "StructureEmbedder",
-]
+_LAZY = {
+    "SentenceTransformerTextEmbedder": (".text_embedder", "SentenceTransformerTextEmbedder"),
+    "CLIPImageEmbedder": (".image_embedder", "CLIPImageEmbedder"),
+    "ESMSequenceEmbedder": (".sequence_embedder", "ESMSequenceEmbedder"),
+    "StructureEmbedder": (".structure_embedder", "StructureEmbedder"),
+}
+
+__all__ = ["BaseEmbedder", *_LAZY]
+
+
+def __getattr__(name):
+    """Import the requested embedder on first access"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
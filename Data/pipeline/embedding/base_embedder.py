@@ -5,6 +5,25 @@ Base embedder class
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 import numpy as np
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+_OUTPUT_DTYPES = {"float32": np.float32, "fp32": np.float32, "float16": np.float16, "fp16": np.float16}
+
+
+def output_dtype(name: str) -> np.dtype:
+    """
+    Resolve the EMBEDDING_DTYPE setting to the dtype embedders return
+
+    Models and normalization still run in float32; float16 only halves
+    the returned vectors. NumPy has no bfloat16, so it isn't offered.
+    """
+    dtype = _OUTPUT_DTYPES.get(name.lower())
+    if dtype is None:
+        logger.warning(f"Unknown embedding dtype '{name}', using float32")
+        dtype = np.float32
+    return np.dtype(dtype)
 
 
 class BaseEmbedder(ABC):
@@ -1,14 +1,36 @@
 """Image embedding using CLIP"""
 
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from pathlib import Path
-from .base_embedder import BaseEmbedder
+from .base_embedder import BaseEmbedder, output_dtype
 from ..config import get_config
 from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+# Threads decoding and preprocessing images ahead of the model
+_LOAD_WORKERS = 8
+
+# CLIP (model, preprocess) per (model name, device), shared between embedders
+_MODEL_CACHE: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _get_or_load(model_name: str, device: str):
+    """Load a CLIP model once per process and share it between embedders"""
+    import clip
+
+    key = (model_name, str(device))
+    with _MODEL_LOCK:
+        if key not in _MODEL_CACHE:
+            model, preprocess = clip.load(model_name, device=device)
+            model.eval()
+            _MODEL_CACHE[key] = (model, preprocess)
+        return _MODEL_CACHE[key]
+
 
 class CLIPImageEmbedder(BaseEmbedder):
     """Embed images using CLIP (512-dim)"""
@@ -23,18 +45,17 @@ class CLIPImageEmbedder(BaseEmbedder):
         self.device = config.device
         self.batch_size = config.batch_size
         self.normalize = config.normalize_embeddings
+        self.output_dtype = output_dtype(config.embedding.embedding_dtype)
         self.model_name = model_name
         self.dimension = 512
         self.model = None
         self.preprocess = None
 
         try:
-            import clip
             # Normalize model name for CLIP (expects names like "ViT-B/32")
             if model_name == "ViT-B-32":
                 model_name = "ViT-B/32"
-            self.model, self.preprocess = clip.load(model_name, device=self.device)
-            self.model.eval()
+            self.model, self.preprocess = _get_or_load(model_name, self.device)
             logger.info(f"✓ Initialized CLIP image embedder: {model_name} (512-dim)")
         except ImportError:
             raise ImportError("Install CLIP: pip install openai-clip")
@@ -47,81 +68,109 @@ class CLIPImageEmbedder(BaseEmbedder):
         image_path = metadata.get("image_path") if metadata else content
 
         if not image_path:
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
 
         try:
-            from PIL import Image
-            import torch
-            
-            path = Path(image_path)
-            if not path.is_absolute() and not path.exists():
-                path = Path(__file__).parent.parent.parent.parent / image_path
-
-            if not path.exists():
+            path = self._resolve_path(image_path)
+            if path is None:
                 logger.warning(f"Image not found: {image_path}")
-                return np.zeros(self.dimension)
-
-            image = Image.open(str(path)).convert('RGB')
-            image_input = self.preprocess(image).unsqueeze(0).to(self.device)
+                return np.zeros(self.dimension, dtype=self.output_dtype)
 
-            with torch.no_grad():
-                embedding = self.model.encode_image(image_input)
-                embedding = embedding.cpu().numpy().astype(np.float32)[0]
-
-            if self.normalize:
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-
-            return np.array(embedding, dtype=np.float32)
+            image_input = self._preprocess_image(path).unsqueeze(0)
+            return self._encode_images(image_input)[0].astype(self.output_dtype)
         except Exception as e:
             logger.error(f"Error embedding image: {e}")
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
 
     def embed_batch(self, contents: List[str], metadata: Optional[List[Dict[str, Any]]] = None) -> np.ndarray:
-        """Embed multiple images"""
+        """Embed multiple images, batch_size images per forward pass
+
+        Rows line up with contents; missing or unreadable images get
+        zero vectors.
+        """
         if metadata:
             image_paths = [m.get("image_path", c) for m, c in zip(metadata, contents)]
         else:
             image_paths = contents
 
-        valid_paths = [p for p in image_paths if p]
+        embeddings = np.zeros((len(contents), self.dimension), dtype=self.output_dtype)
+        if not any(image_paths):
+            return embeddings
+
+        try:
+            batch_size = max(int(self.batch_size or 1), 1)
+            candidates = [i for i, path_str in enumerate(image_paths) if path_str]
+            chunks = [candidates[j:j + batch_size] for j in range(0, len(candidates), batch_size)]
+            # PIL decode and CLIP preprocessing release the GIL, so threads
+            # load the next chunk while the current one is being encoded
+            rows, images = [], []
+            with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, batch_size)) as loader:
+                pending = [loader.submit(self._load_image, image_paths[i]) for i in chunks[0]] if chunks else []
+                for k, chunk in enumerate(chunks):
+                    loaded = pending
+                    if k + 1 < len(chunks):
+                        pending = [loader.submit(self._load_image, image_paths[i]) for i in chunks[k + 1]]
+                    for i, future in zip(chunk, loaded):
+                        image = future.result()
+                        if image is None:
+                            continue
+                        rows.append(i)
+                        images.append(image)
+                        if len(rows) == batch_size:
+                            self._encode_rows(embeddings, rows, images)
+                            rows, images = [], []
+            if rows:
+                self._encode_rows(embeddings, rows, images)
+        except Exception as e:
+            logger.error(f"Error embedding batch: {e}")
+        return embeddings
+
+    def _load_image(self, path_str: str):
+        """Resolve and preprocess one image, or None if it can't be read"""
+        try:
+            path = self._resolve_path(path_str)
+            if path is None:
+                return None
+            return self._preprocess_image(path)
+        except Exception as e:
+            logger.warning(f"Failed to embed image {path_str}: {e}")
+            return None
 
-        if not valid_paths:
-            return np.zeros((len(contents), self.dimension))
+    def _encode_rows(self, embeddings: np.ndarray, rows: List[int], images: List[Any]) -> None:
+        """Encode one batch of preprocessed images into the given rows"""
+        import torch
 
         try:
-            from PIL import Image
-            import torch
-            
-            embeddings = []
-            for path_str in image_paths:
-                try:
-                    path = Path(path_str)
-                    if not path.is_absolute() and not path.exists():
-                        path = Path(__file__).parent.parent.parent.parent / path_str
-
-                    if not path.exists():
-                        embeddings.append(np.zeros(self.dimension, dtype=np.float32))
-                        continue
-
-                    image = Image.open(str(path)).convert('RGB')
-                    image_input = self.preprocess(image).unsqueeze(0).to(self.device)
-
-                    with torch.no_grad():
-                        embedding = self.model.encode_image(image_input)
-                        embedding = embedding.cpu().numpy().astype(np.float32)[0]
-
-                    if self.normalize:
-                        embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-
-                    embeddings.append(embedding)
-                except Exception as e:
-                    logger.warning(f"Failed to embed image {path_str}: {e}")
-                    embeddings.append(np.zeros(self.dimension, dtype=np.float32))
-
-            return np.array(embeddings, dtype=np.float32)
+            embeddings[rows] = self._encode_images(torch.stack(images))
         except Exception as e:
             logger.error(f"Error embedding batch: {e}")
-            return np.zeros((len(contents), self.dimension))
+
+    def _resolve_path(self, image_path: str) -> Optional[Path]:
+        """Find an image path, also relative to the repository root"""
+        path = Path(image_path)
+        if not path.is_absolute() and not path.exists():
+            path = Path(__file__).parent.parent.parent.parent / image_path
+        return path if path.exists() else None
+
+    def _preprocess_image(self, path: Path):
+        """Load an image as a CLIP input tensor (C, H, W)"""
+        from PIL import Image
+
+        with Image.open(str(path)) as image:
+            return self.preprocess(image.convert('RGB'))
+
+    def _encode_images(self, images) -> np.ndarray:
+        """Run CLIP over a (N, C, H, W) tensor; returns (N, dimension) float32"""
+        import torch
+
+        with torch.no_grad():
+            embeddings = self.model.encode_image(images.to(self.device))
+        embeddings = embeddings.float().cpu().numpy()
+
+        if self.normalize:
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8
+
+        return embeddings
 
     def get_dimension(self) -> int:
         """Get embedding dimension"""
@@ -1,13 +1,192 @@
 """Sequence embedding using ESM (Evolutionary Scale Modeling) for proteins"""
 
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import os
+import threading
 import numpy as np
-from .base_embedder import BaseEmbedder
+from .base_embedder import BaseEmbedder, output_dtype
 from ..config import get_config
 from ..logger import get_logger
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 logger = get_logger(__name__)
 
+# Deletes whitespace in a single str.translate pass
+_WHITESPACE = str.maketrans("", "", " \t\n\r\v\f")
+
+_AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _token_table(alphabet) -> np.ndarray:
+    """ASCII code -> ESM token index for the standard amino acids"""
+    table = np.full(128, alphabet.unk_idx, dtype=np.int64)
+    for aa in _AMINO_ACIDS:
+        table[ord(aa)] = alphabet.get_idx(aa)
+    return table
+
+
+def _use_sdpa_attention(model) -> int:
+    """Route ESM self-attention through scaled_dot_product_attention
+
+    fair-esm computes rotary attention with explicit bmm/softmax. The
+    replacement forward keeps the projections and rotary embedding but
+    lets torch pick a fused (flash / memory-efficient) kernel. Calls that
+    need attention weights fall back to the original forward.
+
+    Returns:
+        Number of attention modules patched
+    """
+    import torch
+    import torch.nn.functional as F
+    from esm.multihead_attention import MultiheadAttention
+
+    if not hasattr(F, "scaled_dot_product_attention"):
+        return 0
+
+    def make_forward(attn):
+        eager_forward = attn.forward
+
+        def forward(query, key=None, value=None, key_padding_mask=None, incremental_state=None,
+                    need_weights=True, static_kv=False, attn_mask=None, before_softmax=False,
+                    need_head_weights=False):
+            if (need_head_weights or before_softmax or incremental_state is not None
+                    or attn_mask is not None or key is None or value is None
+                    or attn.bias_k is not None or attn.add_zero_attn):
+                return eager_forward(
+                    query, key, value, key_padding_mask=key_padding_mask,
+                    incremental_state=incremental_state, need_weights=need_weights,
+                    static_kv=static_kv, attn_mask=attn_mask,
+                    before_softmax=before_softmax, need_head_weights=need_head_weights
+                )
+
+            # (T, B, E) -> (B * H, T, D), the layout the rotary embedding expects
+            tgt_len, bsz, embed_dim = query.size()
+            src_len = key.size(0)
+            q = attn.q_proj(query).contiguous().view(tgt_len, -1, attn.head_dim).transpose(0, 1)
+            k = attn.k_proj(key).contiguous().view(src_len, -1, attn.head_dim).transpose(0, 1)
+            v = attn.v_proj(value).contiguous().view(src_len, -1, attn.head_dim).transpose(0, 1)
+            if attn.rot_emb:
+                q, k = attn.rot_emb(q, k)
+
+            mask = None
+            if key_padding_mask is not None:
+                mask = ~key_padding_mask.to(torch.bool).view(bsz, 1, 1, src_len)
+            # Default scale is head_dim ** -0.5, i.e. attn.scaling
+            out = F.scaled_dot_product_attention(
+                q.view(bsz, attn.num_heads, tgt_len, attn.head_dim),
+                k.view(bsz, attn.num_heads, src_len, attn.head_dim),
+                v.view(bsz, attn.num_heads, src_len, attn.head_dim),
+                attn_mask=mask
+            )
+            out = out.permute(2, 0, 1, 3).reshape(tgt_len, bsz, embed_dim)
+            return attn.out_proj(out), None
+
+        return forward
+
+    patched = 0
+    for module in model.modules():
+        if isinstance(module, MultiheadAttention):
+            module.forward = make_forward(module)
+            patched += 1
+    return patched
+
+
+_MODEL_CACHE: Dict[Tuple[str, str, str, bool], Tuple[Any, Any, threading.Lock]] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _get_or_load(model_name: str, device: str, dtype: str, sdpa: bool):
+    """Load an ESM model once per process and share it between embedders
+
+    Cached models are already prepared for inference (on device, eval
+    mode, quantized and SDPA-patched per the settings), so the key holds
+    everything that changes the weights or the forward pass.
+
+    fair-esm models are not safe to run from several threads at once
+    (the rotary embedding caches its cos/sin tables on the module), so
+    each model comes with a lock that its users hold around forward().
+
+    Returns:
+        (model, alphabet, forward lock)
+    """
+    key = (model_name, str(device), dtype, sdpa)
+    if str(device).startswith("cuda"):
+        # Variable-length batches fragment the caching allocator; expandable
+        # segments let blocks grow in place. Only read before the first CUDA
+        # allocation, and an explicit user setting wins.
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+    with _MODEL_LOCK:
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = (*_load_model(model_name, device, dtype, sdpa), threading.Lock())
+        return _MODEL_CACHE[key]
+
+
+def _load_model(model_name: str, device: str, dtype: str, sdpa: bool):
+    """Load a fair-esm model and alphabet and prepare them for inference"""
+    import esm
+    import torch
+
+    pretrained = getattr(esm, "pretrained", None)
+    if pretrained is None:
+        try:
+            import esm.pretrained as pretrained  # type: ignore
+        except Exception as e:
+            raise ImportError(
+                "fair-esm not available or wrong 'esm' package installed. "
+                "Uninstall 'esm' and install 'fair-esm'."
+            ) from e
+
+    # Load ESM model and alphabet (supports multiple fair-esm versions)
+    if hasattr(pretrained, "load_model_and_alphabet"):
+        model, alphabet = pretrained.load_model_and_alphabet(model_name)
+    elif hasattr(pretrained, "load_model_and_alphabet_local"):
+        # Only use local loader if model_name is a valid path
+        from pathlib import Path
+        model_path = Path(model_name)
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Local ESM model not found: {model_name}. "
+                "Provide a valid path or use a model name."
+            )
+        model, alphabet = pretrained.load_model_and_alphabet_local(str(model_path))
+    elif hasattr(pretrained, model_name):
+        model, alphabet = getattr(pretrained, model_name)()
+    else:
+        # Try with esm2_ prefix variants if model_name was custom
+        alt_name = model_name.replace("-", "_")
+        if hasattr(pretrained, alt_name):
+            model, alphabet = getattr(pretrained, alt_name)()
+        else:
+            raise AttributeError("No compatible ESM loader found in fair-esm")
+
+    model = model.to(device)
+    model.eval()
+
+    # int8 swaps the Linear layers for dynamically quantized ones
+    # (int8 weights, activations quantized per call); CPU only
+    if dtype == "int8":
+        if torch.device(device).type == "cpu":
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        else:
+            logger.warning(f"int8 ESM inference needs device=cpu, using fp32 on {device}")
+
+    if sdpa:
+        try:
+            _use_sdpa_attention(model)
+        except Exception as e:
+            logger.warning(f"SDPA attention unavailable, using ESM attention: {e}")
+
+    return model, alphabet
+
 
 class ESMSequenceEmbedder(BaseEmbedder):
     """Embed protein sequences using Meta's ESM models (1280-dim for ESM-2)"""
@@ -25,61 +204,63 @@ class ESMSequenceEmbedder(BaseEmbedder):
         self.device = config.device
         self.batch_size = config.batch_size
         self.normalize = config.normalize_embeddings
+        self.output_dtype = output_dtype(config.embedding.embedding_dtype)
         self.model_name = model_name
         self.dimension = 1280  # ESM-2 default output dimension (may be updated after load)
         self.model = None
         self.alphabet = None
         self.layer_index = None
+        self.autocast_dtype = None
+        self._disk_cache = None
+        # ESM-2 was trained on crops of 1024 tokens (1022 residues + BOS/EOS)
+        self.max_residues = config.embedding.esm_max_residues or None
+        # Repeated sequences (reruns, DMS variants) skip the model; the
+        # cache holds bytes so callers can't mutate a memoized array
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_size = config.embedding.embed_cache_size
+        self._cache_lock = threading.Lock()
 
         try:
-            import esm
             import torch
 
-            pretrained = getattr(esm, "pretrained", None)
-            if pretrained is None:
-                try:
-                    import esm.pretrained as pretrained  # type: ignore
-                except Exception as e:
-                    raise ImportError(
-                        "fair-esm not available or wrong 'esm' package installed. "
-                        "Uninstall 'esm' and install 'fair-esm'."
-                    ) from e
-
-            # Load ESM model and alphabet (supports multiple fair-esm versions)
-            if hasattr(pretrained, "load_model_and_alphabet"):
-                self.model, self.alphabet = pretrained.load_model_and_alphabet(model_name)
-            elif hasattr(pretrained, "load_model_and_alphabet_local"):
-                # Only use local loader if model_name is a valid path
-                from pathlib import Path
-                model_path = Path(model_name)
-                if not model_path.exists():
-                    raise FileNotFoundError(
-                        f"Local ESM model not found: {model_name}. "
-                        "Provide a valid path or use a model name."
-                    )
-                self.model, self.alphabet = pretrained.load_model_and_alphabet_local(str(model_path))
-            elif hasattr(pretrained, model_name):
-                self.model, self.alphabet = getattr(pretrained, model_name)()
-            else:
-                # Try with esm2_ prefix variants if model_name was custom
-                alt_name = model_name.replace("-", "_")
-                if hasattr(pretrained, alt_name):
-                    self.model, self.alphabet = getattr(pretrained, alt_name)()
-                else:
-                    raise AttributeError("No compatible ESM loader found in fair-esm")
+            # Load ESM model and alphabet, shared with other embedders
+            dtype = config.embedding.esm_dtype.lower()
+            self.model, self.alphabet, self._forward_lock = _get_or_load(
+                model_name, self.device, dtype, config.embedding.esm_sdpa
+            )
+
+            # Reduced precision runs the forward under autocast; weights stay
+            # fp32 and pooling is done in fp32
+            dtypes = {"fp16": torch.float16, "bf16": torch.bfloat16}
+            if dtype in dtypes:
+                self.autocast_dtype = dtypes[dtype]
+            elif dtype not in ("fp32", "int8"):
+                logger.warning(f"Unknown ESM dtype '{dtype}', using fp32")
 
-            self.model = self.model.to(self.device)
-            self.model.eval()
+            # Optionally compile the forward pass with TorchInductor.
+            # dynamic=True avoids a recompile for every new sequence length;
+            # the eager model is kept in case the compiled one fails.
+            self._eager_model = self.model
+            if config.embedding.esm_compile and hasattr(torch, "compile"):
+                self.model = torch.compile(self.model, dynamic=True)
 
             # Determine correct last layer index and embedding dimension
             self.layer_index = getattr(self.model, "num_layers", None)
             if self.layer_index is None:
                 self.layer_index = 12
             self.dimension = int(getattr(self.model, "embed_dim", self.dimension))
+            self._token_lut = _token_table(self.alphabet)
+
+            # Embeddings persist across runs when a cache directory is set;
+            # the tag keeps entries from differently configured models apart
+            cache_dir = config.embedding.esm_cache_dir
+            if cache_dir and diskcache is not None:
+                self._disk_cache = diskcache.Cache(cache_dir)
+            self._cache_tag = f"{model_name}|{dtype}|{self.max_residues}|{int(bool(self.normalize))}"
 
             logger.info(
                 f"✓ Initialized ESM sequence embedder: {model_name} "
-                f"(layer={self.layer_index}, dim={self.dimension})"
+                f"(layer={self.layer_index}, dim={self.dimension}, dtype={dtype})"
             )
         except ImportError:
             raise ImportError("Install ESM: pip install fair-esm")
@@ -90,79 +271,235 @@ class ESMSequenceEmbedder(BaseEmbedder):
     def embed(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> np.ndarray:
         """Embed single protein sequence"""
         if not content or not content.strip():
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
 
         try:
-            import torch
-            
-            # Clean sequence (remove whitespace)
-            sequence = content.replace(" ", "").replace("\n", "").upper()
-            
+            sequence = self._clean(content)
+
             # Verify valid amino acids
             if not self._is_valid_protein(sequence):
                 logger.warning(f"Invalid protein sequence: {sequence[:50]}")
-                return np.zeros(self.dimension)
+                return np.zeros(self.dimension, dtype=self.output_dtype)
 
-            # Convert sequence to tokens
-            batch_converter = self.alphabet.get_batch_converter()
-            data = [("protein_1", sequence)]
-            batch_labels, batch_strs, batch_tokens = batch_converter(data)
-
-            # Get embedding
-            batch_tokens = batch_tokens.to(self.device)
-            with torch.no_grad():
-                results = self.model(batch_tokens, repr_layers=[self.layer_index])
-                embedding = results["representations"][self.layer_index].squeeze(0).mean(dim=0)
-            
-            embedding = embedding.cpu().numpy().astype(np.float32)
-
-            if self.normalize:
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-
-            return np.array(embedding, dtype=np.float32)
+            raw = self._lookup(sequence)
+            if raw is None:
+                raw = self._embed_raw(sequence)
+                self._store(sequence, raw)
+            return np.frombuffer(raw, dtype=np.float32).astype(self.output_dtype)
         except Exception as e:
             logger.error(f"Error embedding sequence: {e}")
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
 
     def embed_batch(self, contents: List[str], metadata: Optional[List[Dict[str, Any]]] = None) -> np.ndarray:
-        """Embed multiple protein sequences"""
-        valid_contents = [
-            c.replace(" ", "").replace("\n", "").upper() 
-            for c in contents 
-            if c and self._is_valid_protein(c.replace(" ", "").replace("\n", "").upper())
-        ]
+        """Embed multiple protein sequences in length-sorted mini-batches
+
+        Rows line up with contents; empty or invalid sequences get zero
+        vectors. Sequences are sorted by length and run batch_size at a
+        time, so each mini-batch only pads up to its own longest sequence.
+        The next mini-batch is tokenized on a background thread while the
+        current one runs through the model. Duplicate sequences run once.
+        Results are gathered on the device and copied back in one transfer.
+        With a disk cache, stored sequences are read instead of embedded.
+        """
+        import torch
 
-        if not valid_contents:
-            return np.zeros((len(contents), self.dimension))
+        embeddings = torch.zeros((len(contents), self.dimension), dtype=torch.float32, device=self.device)
+        sequences = [self._clean(c) if c else "" for c in contents]
+        valid = np.array(
+            [i for i, seq in enumerate(sequences) if seq and self._is_valid_protein(seq)],
+            dtype=np.int64
+        )
 
-        try:
-            import torch
-            
-            # Convert sequences to tokens
-            batch_converter = self.alphabet.get_batch_converter()
-            data = [(f"protein_{i}", seq) for i, seq in enumerate(valid_contents)]
-            batch_labels, batch_strs, batch_tokens = batch_converter(data)
+        if valid.size == 0:
+            return np.zeros((len(contents), self.dimension), dtype=self.output_dtype)
+
+        # Index of the first occurrence of each valid sequence
+        first: Dict[str, int] = {}
+        owner = np.fromiter(
+            (first.setdefault(sequences[i], int(i)) for i in valid), dtype=np.int64, count=valid.size
+        )
+        unique = valid[owner == valid]
+        pending_rows = unique
+        if self._disk_cache is not None:
+            pending_rows = self._load_cached_rows(sequences, unique, embeddings)
+
+        lengths = np.fromiter((len(sequences[i]) for i in pending_rows), dtype=np.int64, count=pending_rows.size)
+        ordered = pending_rows[np.argsort(lengths, kind="stable")]
+        batch_size = max(int(self.batch_size or 1), 1)
+        chunks = [ordered[start:start + batch_size] for start in range(0, ordered.size, batch_size)]
+        embedded = []
+
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            if chunks:
+                pending = prefetch.submit(self._tokenize, [sequences[i] for i in chunks[0]])
+            for n, chunk in enumerate(chunks):
+                tokens = pending
+                if n + 1 < len(chunks):
+                    pending = prefetch.submit(self._tokenize, [sequences[i] for i in chunks[n + 1]])
+                try:
+                    rows = torch.from_numpy(chunk).to(embeddings.device)
+                    embeddings[rows] = self._embed_tokens(tokens.result())
+                    embedded.append(chunk)
+                except Exception as e:
+                    logger.error(f"Error embedding batch: {e}")
+
+        if unique.size < valid.size:
+            rows = torch.from_numpy(valid).to(embeddings.device)
+            embeddings[rows] = embeddings[torch.from_numpy(owner).to(embeddings.device)]
+        result = embeddings.cpu().numpy()
+
+        if self._disk_cache is not None:
+            for chunk in embedded:
+                for i in chunk:
+                    self._disk_cache.set(self._disk_key(sequences[i]), result[i].tobytes())
+        # Caches keep float32; only the returned matrix is narrowed
+        return result.astype(self.output_dtype, copy=False)
 
-            # Get embeddings
-            batch_tokens = batch_tokens.to(self.device)
-            with torch.no_grad():
-                results = self.model(batch_tokens, repr_layers=[self.layer_index])
-                embeddings_tensor = results["representations"][self.layer_index]
-                embeddings = embeddings_tensor.mean(dim=1)  # Average over sequence length
+    def _load_cached_rows(self, sequences: List[str], rows: np.ndarray, embeddings) -> np.ndarray:
+        """Fill embeddings from the disk cache and return the rows still missing"""
+        import torch
 
-            embeddings = embeddings.cpu().numpy().astype(np.float32)
+        hits, vectors, misses = [], [], []
+        for i in rows:
+            raw = self._disk_cache.get(self._disk_key(sequences[i]))
+            if raw is None:
+                misses.append(i)
+            else:
+                hits.append(i)
+                vectors.append(np.frombuffer(raw, dtype=np.float32))
+        if hits:
+            cached = torch.from_numpy(np.stack(vectors)).to(embeddings.device)
+            embeddings[torch.tensor(hits, device=embeddings.device)] = cached
+        return np.array(misses, dtype=np.int64)
+
+    def _disk_key(self, sequence: str) -> Tuple[str, bytes]:
+        """Disk cache key: model settings tag plus a 128-bit sequence digest"""
+        return self._cache_tag, hashlib.blake2b(sequence.encode("ascii"), digest_size=16).digest()
+
+    @staticmethod
+    def _clean(content: str) -> str:
+        """Remove whitespace and uppercase a raw sequence"""
+        return content.translate(_WHITESPACE).upper()
+
+    def _embed_raw(self, sequence: str) -> bytes:
+        """Embed one clean, valid sequence as raw float32 bytes (disk-cached)"""
+        if self._disk_cache is None:
+            return self._embed_sequences([sequence])[0].tobytes()
+        key = self._disk_key(sequence)
+        raw = self._disk_cache.get(key)
+        if raw is None:
+            raw = self._embed_sequences([sequence])[0].tobytes()
+            self._disk_cache.set(key, raw)
+        return raw
+
+    def _lookup(self, sequence: str) -> Optional[bytes]:
+        """Memoized embedding bytes for a clean sequence, or None"""
+        with self._cache_lock:
+            raw = self._cache.get(sequence)
+            if raw is not None:
+                self._cache.move_to_end(sequence)
+            return raw
+
+    def _store(self, sequence: str, raw: bytes) -> None:
+        """Memoize embedding bytes, evicting the least recently used entry"""
+        if self._cache_size > 0:
+            with self._cache_lock:
+                self._cache[sequence] = raw
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+    def _embed_sequences(self, sequences: List[str]) -> np.ndarray:
+        """Run one forward pass over clean, valid sequences"""
+        return self._embed_tokens(self._tokenize(sequences)).cpu().numpy()
+
+    def _tokenize(self, sequences: List[str]):
+        """Convert sequences to a token tensor padded to the longest one
+
+        Gives the same tokens as the alphabet's batch converter (with
+        truncation_seq_length=max_residues), but fills one pre-allocated
+        array through a lookup table instead of encoding each sequence
+        into Python lists. Sequences must be clean and valid.
+        For a CUDA device the tensor is pinned, so the host-to-device copy
+        can run asynchronously.
+        """
+        import torch
+
+        alphabet = self.alphabet
+        if self.max_residues:
+            sequences = [seq[:self.max_residues] for seq in sequences]
+        bos = int(alphabet.prepend_bos)
+        eos = int(alphabet.append_eos)
+        width = max(len(seq) for seq in sequences) + bos + eos
+        tokens = np.full((len(sequences), width), alphabet.padding_idx, dtype=np.int64)
+        if bos:
+            tokens[:, 0] = alphabet.cls_idx
+        for row, seq in zip(tokens, sequences):
+            row[bos:bos + len(seq)] = self._token_lut[np.frombuffer(seq.encode("ascii"), dtype=np.uint8)]
+            if eos:
+                row[bos + len(seq)] = alphabet.eos_idx
+
+        batch_tokens = torch.from_numpy(tokens)
+        if str(self.device).startswith("cuda"):
+            batch_tokens = batch_tokens.pin_memory()
+        return batch_tokens
+
+    def _embed_tokens(self, batch_tokens):
+        """Run one forward pass over a token batch from _tokenize
+
+        Returns a float32 tensor on the device, one row per sequence.
+        Each sequence is mean-pooled over its residue tokens only (no BOS,
+        EOS or padding), so every row matches what embed() returns for
+        that sequence.
+        """
+        import torch
+
+        # Pooling and normalization stay on the device; callers decide
+        # when to copy back to the host
+        batch_tokens = batch_tokens.to(self.device, non_blocking=True)
+        with torch.inference_mode():
+            with torch.autocast(
+                device_type=batch_tokens.device.type,
+                dtype=self.autocast_dtype or torch.float32,
+                enabled=self.autocast_dtype is not None
+            ):
+                results = self._forward(batch_tokens)
+            token_embeddings = results["representations"][self.layer_index].float()
+            # Average over each sequence's residues, skipping special tokens
+            alphabet = self.alphabet
+            mask = (
+                (batch_tokens != alphabet.padding_idx)
+                & (batch_tokens != alphabet.cls_idx)
+                & (batch_tokens != alphabet.eos_idx)
+            ).unsqueeze(-1).to(token_embeddings.dtype)
+            pooled = (token_embeddings * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
 
             if self.normalize:
-                embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8)
+                pooled = torch.nn.functional.normalize(pooled, dim=-1, eps=1e-8)
 
-            return np.array(embeddings, dtype=np.float32)
-        except Exception as e:
-            logger.error(f"Error embedding batch: {e}")
-            return np.zeros((len(contents), self.dimension))
+            return pooled
+
+    def _forward(self, batch_tokens):
+        """Run the model, falling back to eager mode if compilation fails
+
+        torch.compile only compiles on the first call, so errors from a
+        missing compiler toolchain or unsupported ops surface here.
+        Only the last layer's representation is requested: no per-head
+        attention maps (which would also bypass SDPA) and no contact head.
+        """
+        kwargs = {"repr_layers": [self.layer_index], "need_head_weights": False, "return_contacts": False}
+        with self._forward_lock:
+            try:
+                return self.model(batch_tokens, **kwargs)
+            except Exception as e:
+                if self.model is self._eager_model:
+                    raise
+                logger.warning(f"Compiled ESM model failed, falling back to eager mode: {e}")
+                self.model = self._eager_model
+                return self.model(batch_tokens, **kwargs)
 
     def _is_valid_protein(self, sequence: str) -> bool:
         """Check if sequence contains only valid amino acids"""
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWY')
+        valid_aa = set(_AMINO_ACIDS)
         return all(c in valid_aa for c in sequence.upper())
 
     def get_dimension(self) -> int:
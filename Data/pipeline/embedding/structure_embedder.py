@@ -1,125 +1,415 @@
 """Structure embedding using lightweight feature extraction"""
 
-from typing import List, Dict, Any, Optional
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
-from .base_embedder import BaseEmbedder
+from .base_embedder import BaseEmbedder, output_dtype
 from ..config import get_config
 from ..logger import get_logger
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = get_logger(__name__)
 
+# ATOM records are fixed-width; the z coordinate ends at column 54
+_ATOM_COLUMNS = 54
+
+# Below this many distinct structures a batch is featurized in-process;
+# shipping PDB text to workers would cost more than it saves
+_PARALLEL_MIN_STRUCTURES = 32
+
+# Per-process embedder used by pool workers
+_WORKER_EMBEDDER = None
+
+
+def _parse_atom_line(line: str) -> Optional[Tuple[str, str, float, float, float, int]]:
+    """Parse one ATOM record, or None if a field is malformed"""
+    try:
+        atom_name = line[12:16].strip()
+        x = float(line[30:38])
+        y = float(line[38:46])
+        z = float(line[46:54])
+        res_num = int(line[22:26])
+        res_name = line[17:20].strip()
+    except (ValueError, IndexError):
+        return None
+    return atom_name, res_name, x, y, z, res_num
+
+
+# Residue name -> composition index; names outside it get -1
+_AA_CODES = {'ALA': 0, 'GLY': 1, 'VAL': 2, 'LEU': 3, 'ILE': 4, 'PRO': 5, 'PHE': 6, 'TRP': 7, 'MET': 8, 'CYS': 9,
+             'SER': 10, 'THR': 11, 'ASN': 12, 'GLN': 13, 'ASP': 14, 'GLU': 15, 'LYS': 16, 'ARG': 17, 'HIS': 18}
+
+# The same table keyed by the three name bytes packed big-endian into an int,
+# sorted for np.searchsorted
+_AA_KEYS = np.array(sorted(int.from_bytes(name.encode("ascii"), "big") for name in _AA_CODES), dtype=np.int64)
+_AA_KEY_CODES = np.array([_AA_CODES[key.to_bytes(3, "big").decode("ascii")] for key in _AA_KEYS.tolist()],
+                         dtype=np.int8)
+
+# Bytes str.strip() removes, among ASCII
+_ASCII_SPACE = np.zeros(256, dtype=bool)
+_ASCII_SPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def _residue_codes(block: np.ndarray) -> np.ndarray:
+    """_AA_CODES index of columns 18-20 per row, -1 for other residues"""
+    names = block[:, 17:20].astype(np.int64)
+    keys = (names[:, 0] << 16) | (names[:, 1] << 8) | names[:, 2]
+    idx = np.minimum(np.searchsorted(_AA_KEYS, keys), len(_AA_KEYS) - 1)
+    return np.where(_AA_KEYS[idx] == keys, _AA_KEY_CODES[idx], np.int8(-1))
+
+
+def _ca_rows(block: np.ndarray) -> np.ndarray:
+    """Rows whose atom name (columns 13-16) strips to 'CA'"""
+    name = block[:, 12:16]
+    space = _ASCII_SPACE[name]
+    is_c = name == ord('C')
+    is_a = name == ord('A')
+    ca = np.zeros(len(block), dtype=bool)
+    for i in range(3):
+        others = [j for j in range(4) if j not in (i, i + 1)]
+        ca |= is_c[:, i] & is_a[:, i + 1] & space[:, others].all(axis=1)
+    return ca
+
+
+def _parse_atom_lines(lines: List[str]) -> Dict[str, np.ndarray]:
+    """Parse ATOM records into parallel arrays, dropping malformed ones
+
+    With numba, the numeric columns of all lines are parsed in one JIT
+    pass over a fixed-width byte block; any field it can't read exactly
+    (exponents, nan, underscores, non-ASCII) goes through float()/int().
+    """
+    if _parse_atom_fields is None or not lines:
+        atoms = [atom for atom in map(_parse_atom_line, lines) if atom is not None]
+        return {
+            'coords': np.array([atom[2:5] for atom in atoms], dtype=np.float32).reshape(-1, 3),
+            'resname_codes': np.array([_AA_CODES.get(atom[1], -1) for atom in atoms], dtype=np.int8),
+            'ca_mask': np.array([atom[0] == 'CA' for atom in atoms], dtype=bool),
+            'res_ids': np.array([atom[5] for atom in atoms], dtype=np.int32),
+        }
+
+    text = "".join([line[:_ATOM_COLUMNS].ljust(_ATOM_COLUMNS) for line in lines])
+    block = np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8).reshape(len(lines), _ATOM_COLUMNS)
+    xyz, res_ids, parsed = _parse_atom_fields(block)
+    if text.isascii():
+        resname_codes = _residue_codes(block)
+        ca_mask = _ca_rows(block)
+    else:
+        # str.strip() also removes non-ASCII whitespace, which the byte block replaced
+        resname_codes = np.array([_AA_CODES.get(line[17:20].strip(), -1) for line in lines], dtype=np.int8)
+        ca_mask = np.array([line[12:16].strip() == 'CA' for line in lines], dtype=bool)
+
+    # Rows the kernel rejected are retried with float()/int() and kept if valid
+    for r in np.flatnonzero(~parsed).tolist():
+        atom = _parse_atom_line(lines[r])
+        if atom is not None:
+            xyz[r] = atom[2:5]
+            res_ids[r] = atom[5]
+            parsed[r] = True
+
+    return {
+        'coords': xyz[parsed].astype(np.float32),
+        'resname_codes': resname_codes[parsed],
+        'ca_mask': ca_mask[parsed],
+        'res_ids': res_ids[parsed].astype(np.int32),
+    }
+
+
+if njit is not None:
+    # Exact powers of ten: digits / 10**k is then correctly rounded, like float()
+    _POW10 = np.array([1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8])
+
+    @njit(cache=True)
+    def _is_space(c):
+        return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+    @njit(cache=True)
+    def _field_bounds(row, start, end):
+        while start < end and _is_space(row[start]):
+            start += 1
+        while end > start and _is_space(row[end - 1]):
+            end -= 1
+        return start, end
+
+    @njit(cache=True)
+    def _parse_decimal(row, start, end):
+        """Plain [+-]digits[.digits] field; ok=False for anything else"""
+        i, end = _field_bounds(row, start, end)
+        negative = False
+        if i < end and (row[i] == 43 or row[i] == 45):
+            negative = row[i] == 45
+            i += 1
+        mantissa = 0
+        digits = 0
+        decimals = 0
+        dot = False
+        while i < end:
+            c = row[i]
+            if 48 <= c <= 57:
+                mantissa = mantissa * 10 + (c - 48)
+                digits += 1
+                if dot:
+                    decimals += 1
+            elif c == 46 and not dot:
+                dot = True
+            else:
+                return 0.0, False
+            i += 1
+        if digits == 0:
+            return 0.0, False
+        value = mantissa / _POW10[decimals]
+        return (-value if negative else value), True
+
+    @njit(cache=True)
+    def _parse_integer(row, start, end):
+        """Plain [+-]digits field; ok=False for anything else"""
+        i, end = _field_bounds(row, start, end)
+        negative = False
+        if i < end and (row[i] == 43 or row[i] == 45):
+            negative = row[i] == 45
+            i += 1
+        if i == end:
+            return 0, False
+        value = 0
+        while i < end:
+            c = row[i]
+            if not 48 <= c <= 57:
+                return 0, False
+            value = value * 10 + (c - 48)
+            i += 1
+        return (-value if negative else value), True
+
+    @njit(cache=True)
+    def _parse_atom_fields(block):
+        """x/y/z (cols 31-54) and residue number (cols 23-26) per row"""
+        n = block.shape[0]
+        xyz = np.empty((n, 3), dtype=np.float64)
+        res_nums = np.empty(n, dtype=np.int64)
+        parsed = np.empty(n, dtype=np.bool_)
+        for r in range(n):
+            row = block[r]
+            x, ok_x = _parse_decimal(row, 30, 38)
+            y, ok_y = _parse_decimal(row, 38, 46)
+            z, ok_z = _parse_decimal(row, 46, 54)
+            res_num, ok_res = _parse_integer(row, 22, 26)
+            xyz[r, 0] = x
+            xyz[r, 1] = y
+            xyz[r, 2] = z
+            res_nums[r] = res_num
+            parsed[r] = ok_x and ok_y and ok_z and ok_res
+        return xyz, res_nums, parsed
+else:
+    _parse_atom_fields = None
+
+
+def _init_worker(normalize: bool) -> None:
+    """Build the featurizer a pool worker reuses for every structure"""
+    global _WORKER_EMBEDDER
+    _WORKER_EMBEDDER = StructureEmbedder(workers=1)
+    _WORKER_EMBEDDER.normalize = normalize
+
+
+def _worker_features(content: str) -> np.ndarray:
+    """Featurize one structure inside a pool worker"""
+    return _WORKER_EMBEDDER._extract_structure_features(content)
+
 
 class StructureEmbedder(BaseEmbedder):
     """Embed protein structures using lightweight PDB feature extraction"""
 
-    def __init__(self):
-        """Initialize structure embedder"""
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize structure embedder
+
+        Args:
+            workers: Processes used by embed_batch. Defaults to 1, which
+                keeps everything in-process; setting MAX_WORKERS (with
+                PARALLEL enabled) opts in to a pool capped at the CPU count.
+                A pool means spawned workers, so the calling script needs an
+                ``if __name__ == "__main__":`` guard, and close() should be
+                called when done
+        """
         config = get_config()
         self.normalize = config.normalize_embeddings
+        self.output_dtype = output_dtype(config.embedding.embedding_dtype)
         self.dimension = 256
+        if workers is None:
+            workers = 1
+            if config.pipeline.parallel and "MAX_WORKERS" in os.environ:
+                workers = min(config.pipeline.max_workers, os.cpu_count() or 1)
+        self.workers = max(1, workers)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # Feature vectors keyed by a content digest, so a protein library
+        # re-embedded across calls is parsed once without holding PDB text
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._cache_size = config.embedding.embed_cache_size
+        self._cache_lock = threading.Lock()
         logger.info("Initialized StructureEmbedder (lightweight)")
 
     def _parse_pdb_minimal(self, content: str) -> Dict[str, Any]:
-        """Parse PDB to extract CA coordinates"""
-        ca_coords = []
-        atoms = []
-        residues = set()
-
-        for line in content.split('\n'):
-            if not line.startswith('ATOM'):
-                continue
-            try:
-                atom_name = line[12:16].strip()
-                x = float(line[30:38])
-                y = float(line[38:46])
-                z = float(line[46:54])
-                res_num = int(line[22:26])
-                res_name = line[17:20].strip()
-
-                atoms.append((atom_name, res_name, x, y, z, res_num))
-                residues.add(res_num)
-
-                if atom_name == 'CA':
-                    ca_coords.append((x, y, z))
-            except (ValueError, IndexError):
-                pass
-
-        return {
-            'ca_coords': np.array(ca_coords, dtype=np.float32) if ca_coords else np.zeros((0, 3)),
-            'atoms': atoms,
-            'residues': residues
-        }
+        """Parse PDB ATOM records into per-atom arrays plus CA coordinates"""
+        pdb_data = _parse_atom_lines([line for line in content.split('\n') if line.startswith('ATOM')])
+        ca_coords = pdb_data['coords'][pdb_data['ca_mask']]
+        pdb_data['ca_coords'] = ca_coords if len(ca_coords) else np.zeros((0, 3))
+        return pdb_data
 
     def _extract_structure_features(self, content: str) -> np.ndarray:
         """Extract 256-dim feature vector from PDB"""
         pdb_data = self._parse_pdb_minimal(content)
         ca_coords = pdb_data['ca_coords']
-        features = []
+        features_array = np.zeros(self.dimension, dtype=np.float32)
 
         if len(ca_coords) > 0:
             # Coordinate statistics
-            features.extend(ca_coords.mean(axis=0).tolist())
-            features.extend(ca_coords.std(axis=0).tolist())
-            features.extend(ca_coords.min(axis=0).tolist())
-            features.extend(ca_coords.max(axis=0).tolist())
+            centroid = ca_coords.mean(axis=0)
+            lo, hi = ca_coords.min(axis=0), ca_coords.max(axis=0)
+            features_array[0:3] = centroid
+            features_array[3:6] = ca_coords.std(axis=0)
+            features_array[6:9] = lo
+            features_array[9:12] = hi
 
-            # Distance statistics
+            # Distance statistics; bond vectors and lengths are reused for the angles
             if len(ca_coords) > 1:
-                distances = [np.linalg.norm(ca_coords[i+1] - ca_coords[i]) for i in range(len(ca_coords)-1)]
-                distances = np.array(distances)
-                features.extend([distances.mean(), distances.std(), distances.min(), distances.max()])
-            else:
-                features.extend([0, 0, 0, 0])
+                bonds = np.diff(ca_coords, axis=0)
+                distances = np.linalg.norm(bonds, axis=1)
+                features_array[12:16] = [distances.mean(), distances.std(), distances.min(), distances.max()]
 
             # Radius of gyration
-            centroid = ca_coords.mean(axis=0)
-            rg = np.sqrt(np.mean(np.sum((ca_coords - centroid) ** 2, axis=1)))
-            features.append(rg)
-
-            # Bounding box
-            bbox = ca_coords.max(axis=0) - ca_coords.min(axis=0)
-            features.extend(bbox.tolist())
-            features.append(np.prod(bbox))
-            features.append(float(len(ca_coords)))
-            features.append(float(len(pdb_data['atoms'])))
+            features_array[16] = np.sqrt(np.mean(np.sum((ca_coords - centroid) ** 2, axis=1)))
+
+            # Bounding box, then CA and atom counts
+            bbox = hi - lo
+            features_array[17:20] = bbox
+            features_array[20] = np.prod(bbox)
+            features_array[21] = len(ca_coords)
+            features_array[22] = len(pdb_data['coords'])
+            composition = 23
         else:
-            features.extend([0] * 31)
+            # Without CA atoms the statistics block is 31 zeros wide
+            composition = 31
 
         # Residue composition
-        aa_codes = {'ALA': 0, 'GLY': 1, 'VAL': 2, 'LEU': 3, 'ILE': 4, 'PRO': 5, 'PHE': 6, 'TRP': 7, 'MET': 8, 'CYS': 9,
-                    'SER': 10, 'THR': 11, 'ASN': 12, 'GLN': 13, 'ASP': 14, 'GLU': 15, 'LYS': 16, 'ARG': 17, 'HIS': 18}
-        residue_names = [atom[1] for atom in pdb_data['atoms']]
-        aa_counts = [residue_names.count(code) for code in aa_codes.keys()]
-        total = sum(aa_counts) + 1e-8
-        features.extend([c / total for c in aa_counts])
-
-        # Secondary structure approximation
+        resname_codes = pdb_data['resname_codes']
+        aa_counts = np.bincount(resname_codes[resname_codes >= 0], minlength=len(_AA_CODES))
+        features_array[composition:composition + len(_AA_CODES)] = aa_counts / (aa_counts.sum() + 1e-8)
+
+        # Secondary structure approximation: cosines between consecutive CA-CA
+        # bonds (one per CA except the last three), filling up to 200 features
+        angles = composition + len(_AA_CODES)
         if len(ca_coords) > 3:
-            for i in range(len(ca_coords) - 3):
-                v1 = ca_coords[i+1] - ca_coords[i]
-                v2 = ca_coords[i+2] - ca_coords[i+1]
-                cos = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-8)
-                features.append(np.clip(cos, -1, 1))
-                if len(features) >= 200:
-                    break
-        features.extend([0] * (self.dimension - len(features)))
-
-        features_array = np.array(features[:self.dimension], dtype=np.float32)
+            n_angles = min(len(ca_coords) - 3, max(200 - angles, 1))
+            v1, v2 = bonds[:n_angles], bonds[1:n_angles + 1]
+            cos = (v1 * v2).sum(axis=1) / (distances[:n_angles] * distances[1:n_angles + 1] + 1e-8)
+            features_array[angles:angles + n_angles] = np.clip(cos, -1, 1)
+
         if self.normalize:
-            features_array = features_array / (np.linalg.norm(features_array) + 1e-8)
+            norm = np.sqrt(np.einsum("i,i->", features_array, features_array)) + 1e-8
+            np.divide(features_array, norm, out=features_array)
 
         return features_array
 
     def embed(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> np.ndarray:
         """Embed single structure"""
         if not content or not content.strip():
-            return np.zeros(self.dimension)
-        return self._extract_structure_features(content)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
+        return self._cached_features(self._content_key(content), content).astype(self.output_dtype)
 
     def embed_batch(self, contents: List[str], metadata: Optional[List[Dict[str, Any]]] = None) -> np.ndarray:
-        """Embed multiple structures"""
-        embeddings = [self.embed(content) for content in contents]
-        return np.array(embeddings, dtype=np.float32)
+        """Embed multiple structures into one pre-allocated matrix"""
+        embeddings = np.zeros((len(contents), self.dimension), dtype=self.output_dtype)
+        # Identical structures are featurized once and fanned out
+        rows: Dict[bytes, List[int]] = {}
+        unique: Dict[bytes, str] = {}
+        for i, content in enumerate(contents):
+            if content and content.strip():
+                key = self._content_key(content)
+                rows.setdefault(key, []).append(i)
+                unique.setdefault(key, content)
+        pending = {}
+        for key, content in unique.items():
+            features = self._lookup(key)
+            if features is None:
+                pending[key] = content
+            else:
+                embeddings[rows[key]] = features
+
+        for key, features in zip(pending, self._featurize_many(list(pending.values()))):
+            embeddings[rows[key]] = features
+            self._store(key, features)
+        return embeddings
+
+    def _featurize_many(self, contents: List[str]) -> List[np.ndarray]:
+        """Featurize structures, across worker processes for large batches"""
+        if self.workers > 1 and len(contents) >= _PARALLEL_MIN_STRUCTURES:
+            chunksize = max(1, len(contents) // (4 * self.workers))
+            try:
+                return list(self._get_pool().map(_worker_features, contents, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Parallel structure featurization failed, running in-process: {e}")
+                with self._pool_lock:
+                    pool, self._pool = self._pool, None
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+        return [self._extract_structure_features(content) for content in contents]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use and keep it for later batches"""
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn, not fork: the parent may hold torch/CUDA state and threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.normalize,),
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _content_key(content: str) -> bytes:
+        """128-bit digest of a PDB text"""
+        return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cached_features(self, key: bytes, content: str) -> np.ndarray:
+        """Features for content, memoized by its digest (callers must not mutate)"""
+        features = self._lookup(key)
+        if features is not None:
+            return features
+        features = self._extract_structure_features(content)
+        self._store(key, features)
+        return features
+
+    def _lookup(self, key: bytes) -> Optional[np.ndarray]:
+        """Memoized features for a digest, or None"""
+        with self._cache_lock:
+            features = self._cache.get(key)
+            if features is not None:
+                self._cache.move_to_end(key)
+            return features
+
+    def _store(self, key: bytes, features: np.ndarray) -> None:
+        """Memoize features, evicting the least recently used entry"""
+        if self._cache_size > 0:
+            with self._cache_lock:
+                self._cache[key] = features
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
 
     def get_dimension(self) -> int:
         """Get embedding dimension"""
@@ -1,13 +1,111 @@
 """Text embedding using SentenceTransformers"""
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import os
+import platform
+import queue
+import threading
 import numpy as np
-from .base_embedder import BaseEmbedder
+from .base_embedder import BaseEmbedder, output_dtype
 from ..config import get_config
 from ..logger import get_logger
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 logger = get_logger(__name__)
 
+# Small encoders like MiniLM stop scaling after a few intra-op threads
+_AUTO_THREAD_CAP = 4
+_torch_threads_set = False
+
+# Loaded models shared by every embedder with the same settings, so
+# constructing another embedder doesn't reload the model or its ORT session.
+# Values are (model, backend actually used).
+_MODEL_CACHE: Dict[Tuple[str, str, str, bool, int], Tuple[Any, str]] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _thread_count(configured: int) -> int:
+    """Intra-op threads for the text model: configured, else physical cores up to the cap"""
+    if configured > 0:
+        return configured
+    physical = psutil.cpu_count(logical=False) if psutil is not None else None
+    return max(1, min(_AUTO_THREAD_CAP, physical or (os.cpu_count() or 2) // 2))
+
+
+def _set_torch_threads(threads: int) -> None:
+    """Apply a torch thread limit once per process (it is process-wide)"""
+    global _torch_threads_set
+    if _torch_threads_set:
+        return
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed before any inter-op work has started
+        pass
+    _torch_threads_set = True
+
+
+def _quantized_onnx_file() -> str:
+    """Pick the hub's int8 ONNX export matching this CPU"""
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    try:
+        if "avx512_vnni" in Path("/proc/cpuinfo").read_text():
+            return "onnx/model_qint8_avx512_vnni.onnx"
+    except OSError:
+        pass
+    return "onnx/model_quint8_avx2.onnx"
+
+
+class _MicroBatcher:
+    """Coalesce concurrent single-text requests into one encode() call
+
+    A worker thread takes the first waiting text plus whatever else is
+    already queued (up to max_batch) and encodes them together. It never
+    waits for more requests, so a lone caller sees no added latency while
+    concurrent callers share forward passes.
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], max_batch: int):
+        self._encode = encode
+        self._max_batch = max(max_batch, 1)
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="text-embed-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue one text; the future resolves to its embedding row"""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self._max_batch:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                vectors = self._encode([text for text, _ in items])
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), vector in zip(items, vectors):
+                future.set_result(vector)
+
 
 class SentenceTransformerTextEmbedder(BaseEmbedder):
     """Embed text using Sentence Transformers (384-dim)"""
@@ -22,52 +120,149 @@ class SentenceTransformerTextEmbedder(BaseEmbedder):
         self.device = config.device
         self.batch_size = config.batch_size
         self.normalize = config.normalize_embeddings
+        self.output_dtype = output_dtype(config.embedding.embedding_dtype)
         self.dimension = 384
         self.model_name = model_name
+        self.backend = config.embedding.text_backend.lower()
+        self.quantize = config.embedding.quantize_embeddings
+        self.threads = config.embedding.embedding_threads
+        self._batcher: Optional[_MicroBatcher] = None
+        self._batcher_lock = threading.Lock()
 
         try:
-            from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(f'sentence-transformers/{model_name}', device=self.device)
-            logger.info(f"✓ Initialized SentenceTransformer text embedder: {model_name} (384-dim)")
+            self.model = self._get_or_load(f'sentence-transformers/{model_name}')
+            logger.info(
+                f"✓ Initialized SentenceTransformer text embedder: {model_name} "
+                f"(384-dim, backend={self.backend})"
+            )
         except ImportError:
             raise ImportError("Install sentence-transformers: pip install sentence-transformers")
         except Exception as e:
             logger.error(f"✗ Failed to load SentenceTransformer: {e}")
             raise
 
+    def _get_or_load(self, model_id: str):
+        """Load the model once per process for these settings and share it"""
+        key = (model_id, str(self.device), self.backend, bool(self.quantize), self.threads)
+        with _MODEL_LOCK:
+            if key not in _MODEL_CACHE:
+                _MODEL_CACHE[key] = (self._load_model(model_id), self.backend)
+            model, self.backend = _MODEL_CACHE[key]
+        return model
+
+    def _load_model(self, model_id: str):
+        """Load the model on ONNX Runtime if possible, else on PyTorch
+
+        The ONNX backend (sentence-transformers >= 3.2 with optimum and
+        onnxruntime) runs the exported graph with all ORT graph
+        optimizations, which fuse the encoder's MatMul/Add/GELU and
+        attention ops. On CUDA the hub's O4 export (fp16) is used; on CPU
+        with quantize_embeddings, the dynamically quantized int8 export
+        for this CPU is tried first.
+        """
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend == "onnx" and find_spec("onnxruntime") is not None:
+            try:
+                import onnxruntime as ort
+
+                options = ort.SessionOptions()
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                options.intra_op_num_threads = _thread_count(self.threads)
+                options.inter_op_num_threads = 1
+                cuda = str(self.device).startswith("cuda")
+                if cuda:
+                    files = ["onnx/model_O4.onnx"]
+                elif self.quantize:
+                    files = [_quantized_onnx_file(), "onnx/model.onnx"]
+                else:
+                    files = ["onnx/model.onnx"]
+
+                for n, file_name in enumerate(files, 1):
+                    try:
+                        return SentenceTransformer(
+                            model_id,
+                            device=self.device,
+                            backend="onnx",
+                            model_kwargs={
+                                "file_name": file_name,
+                                "provider": "CUDAExecutionProvider" if cuda else "CPUExecutionProvider",
+                                "session_options": options,
+                                # Bind torch input/output buffers to the session on
+                                # the GPU instead of staging them through numpy;
+                                # on CPU numpy views of the tensors are already
+                                # zero-copy, so plain run() is kept there
+                                "use_io_binding": cuda,
+                            },
+                        )
+                    except Exception as e:
+                        if n == len(files):
+                            raise
+                        logger.warning(f"Could not load {file_name} for {model_id}: {e}")
+            except Exception as e:
+                logger.warning(f"ONNX backend unavailable for {model_id}, using PyTorch: {e}")
+
+        self.backend = "torch"
+        # torch threads are shared with the CLIP and ESM models, so they are
+        # only capped when EMBEDDING_THREADS is set explicitly
+        if self.threads > 0:
+            _set_torch_threads(self.threads)
+        return SentenceTransformer(model_id, device=self.device)
+
     def embed(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> np.ndarray:
         """Embed single text"""
         if not content or not content.strip():
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
 
         try:
-            embedding = self.model.encode(content, convert_to_numpy=True)
-
-            if self.normalize:
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-
-            return np.array(embedding, dtype=np.float32)
+            # Copy out of the micro-batch matrix; encode() already normalized it
+            return np.array(self._get_batcher().submit(content).result(), dtype=self.output_dtype)
         except Exception as e:
             logger.error(f"Error embedding text: {e}")
-            return np.zeros(self.dimension)
+            return np.zeros(self.dimension, dtype=self.output_dtype)
+
+    def _get_batcher(self) -> _MicroBatcher:
+        """Start the micro-batching worker on first use"""
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = _MicroBatcher(
+                        lambda texts: self.model.encode(
+                            texts, convert_to_numpy=True, batch_size=self.batch_size,
+                            normalize_embeddings=self.normalize
+                        ),
+                        self.batch_size
+                    )
+        return self._batcher
 
     def embed_batch(self, contents: List[str], metadata: Optional[List[Dict[str, Any]]] = None) -> np.ndarray:
-        """Embed multiple texts"""
-        valid_contents = [c for c in contents if c and c.strip()]
+        """Embed multiple texts
 
-        if not valid_contents:
-            return np.zeros((len(contents), self.dimension))
+        Rows line up with contents; empty texts get zero vectors.
+        SentenceTransformer.encode already sorts texts by length before
+        batching, so each mini-batch only pads to its own longest text.
+        """
+        embeddings = np.zeros((len(contents), self.dimension), dtype=self.output_dtype)
+        valid = [i for i, c in enumerate(contents) if c and c.strip()]
 
-        try:
-            embeddings = self.model.encode(valid_contents, convert_to_numpy=True, batch_size=self.batch_size)
+        if not valid:
+            return embeddings
 
-            if self.normalize:
-                embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8)
+        try:
+            # encode() L2-normalizes on the model's device before the
+            # transfer, so there is no second pass over the matrix here
+            encoded = np.asarray(self.model.encode(
+                [contents[i] for i in valid], convert_to_numpy=True, batch_size=self.batch_size,
+                normalize_embeddings=self.normalize
+            ), dtype=np.float32)
 
-            return np.array(embeddings, dtype=np.float32)
+            # No empty texts: the encoded matrix already is the result
+            if len(valid) == len(contents):
+                return encoded.astype(self.output_dtype, copy=False)
+            embeddings[valid] = encoded
         except Exception as e:
             logger.error(f"Error embedding batch: {e}")
-            return np.zeros((len(contents), self.dimension))
+        return embeddings
 
     def get_dimension(self) -> int:
         """Get embedding dimension"""
@@ -354,27 +354,41 @@ class QDesignPipeline:
         """
         logger.info(f"Starting full pipeline with collector {collector_name}")
         
-        # Collection
-        collected = self.collect(collector_name, *args, **kwargs)
-        
-        # Ingestion
-        self.ingest(collected)
-        
-        # Normalization
-        self.normalize()
-        
-        # Enrichment
-        self.enrich()
-        
-        # Embedding
-        self.embed()
-        
-        # Storage
-        stored = self.store()
+        try:
+            # Collection
+            collected = self.collect(collector_name, *args, **kwargs)
+            
+            # Ingestion
+            self.ingest(collected)
+            
+            # Normalization
+            self.normalize()
+            
+            # Enrichment
+            self.enrich()
+            
+            # Embedding
+            self.embed()
+            
+            # Storage
+            stored = self.store()
+        finally:
+            self.close()
         
         logger.info(f"Pipeline complete. Processed {stored} records")
         return stored
     
+    def close(self) -> None:
+        """Release resources held by registered embedders (e.g. worker pools)"""
+        for name, embedder in self.embedders.items():
+            close = getattr(embedder, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Failed to close embedder {name}: {e}")
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics"""
         total_records = len(self.records)
@@ -13,19 +13,28 @@ logger = get_logger(__name__)
 class QdrantClient:
     """Client for Qdrant vector database"""
     
-    def __init__(self):
-        """Initialize Qdrant client"""
+    def __init__(self, prefer_grpc: Optional[bool] = None):
+        """
+        Initialize Qdrant client
+
+        Args:
+            prefer_grpc: Use the gRPC transport (HTTP/2) instead of REST;
+                defaults to QDRANT_PREFER_GRPC
+        """
         try:
             from qdrant_client import QdrantClient as QC
-            from qdrant_client.models import Distance, VectorParams, PointStruct
+            from qdrant_client.models import Distance, VectorParams, PointStruct, PayloadSelectorExclude
             
             self.QC = QC
             self.Distance = Distance
             self.VectorParams = VectorParams
             self.PointStruct = PointStruct
+            self.PayloadSelectorExclude = PayloadSelectorExclude
             
             config = get_config()
-            self.client = QC(url=config.storage.qdrant_url)
+            if prefer_grpc is None:
+                prefer_grpc = config.storage.qdrant_prefer_grpc
+            self.client = QC(url=config.storage.qdrant_url, prefer_grpc=prefer_grpc)
             self.text_collection = config.storage.qdrant_collection_text
             self.structure_collection = config.storage.qdrant_collection_structures
             self.sequence_collection = config.storage.qdrant_collection_sequences
@@ -185,51 +194,83 @@ class QdrantClient:
             logger.error(f"Error upserting batch: {e}")
             return 0
     
-    def search(
+    def search_points(
         self,
         collection_name: str,
         vector: np.ndarray,
         limit: int = 10,
-        score_threshold: Optional[float] = None
-    ) -> List[Dict[str, Any]]:
+        score_threshold: Optional[float] = None,
+        exclude_payload: Optional[List[str]] = None
+    ) -> List[Any]:
         """
-        Search for similar vectors using query API
+        Search for similar vectors, returning raw ScoredPoint objects
         
         Args:
             collection_name: Collection name
             vector: Query vector
             limit: Number of results
             score_threshold: Minimum score threshold
+            exclude_payload: Payload keys for Qdrant to strip server-side
         
         Returns:
-            List of results with metadata
+            List of ScoredPoint (attributes: id, score, payload)
         """
         try:
             if isinstance(vector, np.ndarray):
                 vector = vector.tolist()
             
+            with_payload = (
+                self.PayloadSelectorExclude(exclude=list(exclude_payload))
+                if exclude_payload else True
+            )
+            
             # Use query_points API (standard in modern Qdrant)
             result_obj = self.client.query_points(
                 collection_name=collection_name,
                 query=vector,
                 limit=limit,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                with_payload=with_payload
             )
-            results = result_obj.points if hasattr(result_obj, 'points') else result_obj
-            
-            return [
-                {
-                    "id": str(r.id),
-                    "score": float(r.score) if hasattr(r, 'score') else 0.0,
-                    "metadata": dict(r.payload) if hasattr(r, 'payload') else {}
-                }
-                for r in results
-            ]
+            return result_obj.points if hasattr(result_obj, 'points') else result_obj
             
         except Exception as e:
             logger.error(f"Error searching collection '{collection_name}': {type(e).__name__}: {e}")
             return []
     
+    def search(
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        exclude_payload: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar vectors using query API
+        
+        Args:
+            collection_name: Collection name
+            vector: Query vector
+            limit: Number of results
+            score_threshold: Minimum score threshold
+            exclude_payload: Payload keys for Qdrant to strip server-side
+        
+        Returns:
+            List of results with metadata
+        """
+        results = self.search_points(
+            collection_name, vector, limit, score_threshold, exclude_payload
+        )
+        return [
+            {
+                "id": str(r.id),
+                "score": float(r.score) if hasattr(r, 'score') else 0.0,
+                "metadata": dict(r.payload) if hasattr(r, 'payload') else {}
+            }
+            for r in results
+        ]
+    
     def get_stats(self, collection_name: str) -> Dict[str, Any]:
         """
         Get collection statistics
@@ -1,11 +1,26 @@
 """Finalization API routes"""
 
+from typing import Dict, Iterator
+
+import orjson
+
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from ..services.finalization import FinalizationService
 
 router_finalization = APIRouter(tags=["finalization"])
 
 
+def _stream_export(export: Dict) -> Iterator[bytes]:
+    """Serialize an export as JSON, emitting one resource at a time"""
+    resources = export.pop("resources")
+    header = orjson.dumps(export)
+    yield header[:-1] + b',"resources":['
+    for idx, resource in enumerate(resources):
+        yield (b"," if idx else b"") + orjson.dumps(resource)
+    yield b"]}"
+
+
 async def get_finalization_service(request: Request) -> FinalizationService:
     """Inject finalization service with DB from app"""
     db = next(request.app.get_db())
@@ -25,13 +40,14 @@ async def finalize_knowledge_base(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router_finalization.get("/{kb_id}/export", response_model=dict)
+@router_finalization.get("/{kb_id}/export")
 async def export_for_graph(
     kb_id: str,
     service: FinalizationService = Depends(get_finalization_service)
 ):
-    """Export KB for graph construction service"""
+    """Export KB for graph construction service (streamed JSON)"""
     try:
-        return service.export_for_graph(kb_id)
+        export = service.export_for_graph(kb_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return StreamingResponse(_stream_export(export), media_type="application/json")
@@ -1,6 +1,7 @@
 """Retrieval API routes"""
 
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from ..services.retrieval import RetrievalService
 
 router_retrieval = APIRouter(tags=["retrieval"])
@@ -12,13 +13,13 @@ async def get_retrieval_service(request: Request) -> RetrievalService:
     return RetrievalService(db=db)
 
 
-@router_retrieval.get("/{kb_id}", response_model=dict)
+@router_retrieval.get("/{kb_id}", response_class=ORJSONResponse)
 async def get_knowledge_base(
     kb_id: str,
     service: RetrievalService = Depends(get_retrieval_service)
 ):
     """Get knowledge base with resources and annotations"""
     try:
-        return service.get_knowledge_base(kb_id)
+        return ORJSONResponse(service.get_knowledge_base(kb_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,6 +1,6 @@
 """Resource annotation ORM model"""
 
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from uuid import uuid4
@@ -11,6 +11,9 @@ from .base import Base
 class ResourceAnnotation(Base):
     """User annotations on resources"""
     __tablename__ = "resource_annotations"
+    __table_args__ = (
+        Index("ix_annot_resource_id", "resource_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     resource_id = Column(String, ForeignKey("knowledge_resources.id"), nullable=False)
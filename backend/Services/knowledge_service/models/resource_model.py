@@ -1,6 +1,6 @@
 """Knowledge resource ORM model"""
 
-from sqlalchemy import Column, String, Float, Integer, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, Float, Integer, DateTime, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from uuid import uuid4
@@ -11,6 +11,10 @@ from .base import Base
 class KnowledgeResource(Base):
     """Individual resource in knowledge base"""
     __tablename__ = "knowledge_resources"
+    __table_args__ = (
+        # Serves "included resources of a KB in priority order"
+        Index("ix_res_kb_inc_order", "knowledge_base_id", "included", "order"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     knowledge_base_id = Column(String, ForeignKey("knowledge_bases.id"), nullable=False)
@@ -3,6 +3,8 @@
 import logging
 from sqlalchemy.orm import Session
 
+from ..models import KnowledgeBase, KnowledgeResource
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,3 +17,25 @@ class BaseKnowledgeService:
         self.qdrant = qdrant_client
         self.embedder = embedder
         self.logger = logger
+
+    def _get_kb(self, kb_id: str, options=None) -> KnowledgeBase:
+        """Fetch knowledge base by id via the session identity map
+
+        Session.get ignores loader options for an object already in the
+        identity map, so with options the row is reloaded
+        (populate_existing) for the eager loads to take effect.
+        """
+        if options:
+            kb = self.db.get(KnowledgeBase, kb_id, options=options, populate_existing=True)
+        else:
+            kb = self.db.get(KnowledgeBase, kb_id)
+        if not kb:
+            raise ValueError(f"Knowledge base {kb_id} not found")
+        return kb
+
+    def _get_resource(self, resource_id: str) -> KnowledgeResource:
+        """Fetch resource by id via the session identity map"""
+        resource = self.db.get(KnowledgeResource, resource_id)
+        if not resource:
+            raise ValueError(f"Resource {resource_id} not found")
+        return resource
@@ -2,6 +2,8 @@
 
 from typing import List, Optional, Dict
 
+from sqlalchemy import update
+
 from ..models import KnowledgeBase, KnowledgeResource, ResourceAnnotation
 from .base import BaseKnowledgeService
 
@@ -11,9 +13,7 @@ class CurationService(BaseKnowledgeService):
 
     def delete_resource(self, resource_id: str) -> bool:
         """Soft delete resource"""
-        resource = self.db.query(KnowledgeResource).filter_by(id=resource_id).first()
-        if not resource:
-            raise ValueError(f"Resource {resource_id} not found")
+        resource = self._get_resource(resource_id)
         resource.included = False
         self.db.commit()
         self.logger.info(f"Deleted resource {resource_id}")
@@ -29,9 +29,7 @@ class CurationService(BaseKnowledgeService):
         comment: Optional[str] = None
     ) -> KnowledgeResource:
         """Add manually provided resource"""
-        kb = self.db.query(KnowledgeBase).filter_by(id=kb_id).first()
-        if not kb:
-            raise ValueError(f"Knowledge base {kb_id} not found")
+        self._get_kb(kb_id)
 
         resource = KnowledgeResource(
             knowledge_base_id=kb_id,
@@ -44,7 +42,6 @@ class CurationService(BaseKnowledgeService):
             explanation="User manually added",
             resource_metadata=metadata or {}
         )
-        kb.resources.append(resource)
         self.db.add(resource)
         self.db.commit()
 
@@ -62,9 +59,7 @@ class CurationService(BaseKnowledgeService):
         confidence_score: Optional[float] = None
     ) -> ResourceAnnotation:
         """Add annotation to resource"""
-        resource = self.db.query(KnowledgeResource).filter_by(id=resource_id).first()
-        if not resource:
-            raise ValueError(f"Resource {resource_id} not found")
+        resource = self._get_resource(resource_id)
 
         annotation = ResourceAnnotation(
             resource_id=resource_id,
@@ -74,18 +69,21 @@ class CurationService(BaseKnowledgeService):
             confidence_score=confidence_score
         )
         self.db.add(annotation)
-        resource.knowledge_base.total_annotations += 1
+        # Increment in SQL so the knowledge_base relationship is never loaded
+        self.db.execute(
+            update(KnowledgeBase)
+            .where(KnowledgeBase.id == resource.knowledge_base_id)
+            .values(total_annotations=KnowledgeBase.total_annotations + 1)
+        )
         self.db.commit()
         return annotation
 
     def reorder_resources(self, kb_id: str, resource_ids: List[str]) -> bool:
         """Reorder resources by priority"""
-        kb = self.db.query(KnowledgeBase).filter_by(id=kb_id).first()
-        if not kb:
-            raise ValueError(f"Knowledge base {kb_id} not found")
+        self._get_kb(kb_id)
 
         for idx, rid in enumerate(resource_ids):
-            r = self.db.query(KnowledgeResource).filter_by(id=rid).first()
+            r = self.db.get(KnowledgeResource, rid)
             if r:
                 r.order = idx
         self.db.commit()
@@ -1,19 +1,41 @@
 """Resource discovery service - find relevant materials via Qdrant"""
 
 from typing import List, Dict
+from functools import lru_cache
+import logging
 import sys
 from pathlib import Path
 from ..models import KnowledgeBase, KnowledgeResource
 from ..utils.extractors import extract_key_terms
+from ..utils._embedder_cache import get_text_embedder
 from .base import BaseKnowledgeService
-from .discovery_search import search_collection
-from .discovery_filters import filter_and_rank, deduplicate_results
+from .discovery_search import search_collection, build_explanation
+from .discovery_filters import dedup_and_rank
 
 # Add Services to path for Qdrant imports
 services_dir = Path(__file__).parent.parent.parent
 if str(services_dir) not in sys.path:
     sys.path.insert(0, str(services_dir))
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_qdrant():
+    """Process-wide Qdrant client, shared by all requests
+
+    The transport follows QDRANT_PREFER_GRPC. One get_collections() call
+    checks the server is reachable, so a dead endpoint raises here (and,
+    not being cached, is retried by the next service) instead of
+    turning every search into an empty result.
+    """
+    from pipeline.storage.qdrant_client import QdrantClient
+    qdrant = QdrantClient()
+    collections = qdrant.client.get_collections()
+    num = len(collections.collections) if collections else 0
+    logger.info(f"✓ Connected to Qdrant - {num} collections available")
+    return qdrant
+
 
 class DiscoveryService(BaseKnowledgeService):
     """Orchestrates discovery of resources from Qdrant"""
@@ -29,11 +51,7 @@ class DiscoveryService(BaseKnowledgeService):
         if self.qdrant is not None:
             return
         try:
-            from pipeline.storage.qdrant_client import QdrantClient
-            self.qdrant = QdrantClient()
-            collections = self.qdrant.client.get_collections()
-            num = len(collections.collections) if collections else 0
-            self.logger.info(f"✓ Connected to Qdrant - {num} collections available")
+            self.qdrant = _get_qdrant()
         except Exception as e:
             self.logger.error(f"✗ Qdrant failed: {e}")
             self.qdrant = None
@@ -43,9 +61,7 @@ class DiscoveryService(BaseKnowledgeService):
         if self.embedder is not None:
             return
         try:
-            from pipeline.embedding import SentenceTransformerTextEmbedder
-            self.embedder = SentenceTransformerTextEmbedder(model_name="all-MiniLM-L6-v2")
-            self.logger.info("✓ Initialized SentenceTransformer text embedder (384-dim)")
+            self.embedder = get_text_embedder()
         except Exception as e:
             self.logger.error(f"✗ SentenceTransformer failed: {e}")
             self.embedder = None
@@ -64,25 +80,30 @@ class DiscoveryService(BaseKnowledgeService):
         key_terms = extract_key_terms(project_description)
         self.logger.info(f"Extracted {len(key_terms)} key terms")
 
-        proteins = search_collection(self.qdrant, self.embedder, "qdesign_structures", key_terms, top_k, "protein")
-        papers = search_collection(self.qdrant, self.embedder, "qdesign_text", key_terms, top_k, "paper")
-        images = search_collection(self.qdrant, self.embedder, "qdesign_images", key_terms, top_k, "image")
-        sequences = search_collection(self.qdrant, self.embedder, "qdesign_sequences", key_terms, top_k, "sequence")
+        # One batched embedding call, reused by all four collection searches
+        term_vectors = dict(zip(key_terms, self.embedder.embed_batch(key_terms))) if key_terms else {}
+
+        proteins = search_collection(self.qdrant, "qdesign_structures", term_vectors, top_k, "protein")
+        papers = search_collection(self.qdrant, "qdesign_text", term_vectors, top_k, "paper")
+        images = search_collection(self.qdrant, "qdesign_images", term_vectors, top_k, "image")
+        sequences = search_collection(self.qdrant, "qdesign_sequences", term_vectors, top_k, "sequence")
 
         all_resources = proteins + papers + images + sequences
         self.logger.info(f"Found {len(all_resources)} results")
 
-        all_resources = deduplicate_results(all_resources)
-        filtered = filter_and_rank(all_resources, min_relevance, top_k)
+        filtered = dedup_and_rank(all_resources, min_relevance, top_k)
         self.logger.info(f"Returning {len(filtered)} resources")
 
         return self._create_knowledge_base(project_id, filtered)
 
     def _create_knowledge_base(self, project_id: str, resources: List[Dict]) -> KnowledgeBase:
         """Create KB in database with resources"""
-        kb = KnowledgeBase(project_id=project_id, status="discovering")
-        for idx, res in enumerate(resources):
-            resource = KnowledgeResource(
+        kb = KnowledgeBase(project_id=project_id, status="discovering", total_resources=len(resources))
+        self.db.add(kb)
+        # Flush to get kb.id; resources link via FK, not the kb.resources collection
+        self.db.flush()
+        self.db.add_all([
+            KnowledgeResource(
                 knowledge_base_id=kb.id,
                 resource_type=res["resource_type"],
                 source=res["source"],
@@ -91,12 +112,11 @@ class DiscoveryService(BaseKnowledgeService):
                 url=res.get("url"),
                 relevance_score=res["relevance_score"],
                 matching_keywords=res["matching_keywords"],
-                explanation=res["explanation"],
+                explanation=build_explanation(res),
                 resource_metadata=res.get("resource_metadata", {}),
                 order=idx
             )
-            kb.resources.append(resource)
-        kb.total_resources = len(resources)
-        self.db.add(kb)
+            for idx, res in enumerate(resources)
+        ])
         self.db.commit()
         return kb
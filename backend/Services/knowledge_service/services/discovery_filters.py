@@ -3,17 +3,40 @@
 from typing import List, Dict
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many resources the pure-Python path is faster than building arrays
+_VECTORIZE_THRESHOLD = 256
+
 
 def filter_and_rank(resources: List[Dict], min_relevance: float, top_k: int) -> List[Dict]:
     """Filter by relevance and rank by score"""
     min_score = min_relevance * 100
+    if len(resources) > _VECTORIZE_THRESHOLD:
+        return _filter_and_rank_np(resources, min_score, top_k)
     filtered = [r for r in resources if r["relevance_score"] >= min_score]
     ranked = sorted(filtered, key=lambda x: x["relevance_score"], reverse=True)
     return ranked[:top_k]
 
 
+def _filter_and_rank_np(resources: List[Dict], min_score: float, top_k: int) -> List[Dict]:
+    """NumPy variant of filter_and_rank for large result sets"""
+    scores = np.fromiter(
+        (r["relevance_score"] for r in resources), dtype=np.float64, count=len(resources)
+    )
+    idx = np.flatnonzero(scores >= min_score)
+    # Stable sort keeps ties in input order, matching sorted(..., reverse=True)
+    top = idx[np.argsort(-scores[idx], kind="stable")[:top_k]]
+    return [resources[i] for i in top]
+
+
 def deduplicate_results(resources: List[Dict]) -> List[Dict]:
     """Remove duplicate resources by external_id"""
     seen = set()
@@ -24,3 +47,49 @@ def deduplicate_results(resources: List[Dict]) -> List[Dict]:
             seen.add(rid)
             unique.append(r)
     return unique
+
+
+def dedup_and_rank(resources: List[Dict], min_relevance: float, top_k: int) -> List[Dict]:
+    """Deduplicate, filter and rank in one pass
+
+    Same result as ``filter_and_rank(deduplicate_results(...))``; large
+    inputs go through a Numba kernel when numba is installed.
+    """
+    if _dedup_topk is None or len(resources) <= _VECTORIZE_THRESHOLD:
+        return filter_and_rank(deduplicate_results(resources), min_relevance, top_k)
+
+    # Dense integer codes per external_id; -1 marks resources without one
+    codes: Dict[str, int] = {}
+    ids = np.fromiter(
+        (codes.setdefault(rid, len(codes)) if rid else -1
+         for rid in (r.get("external_id") for r in resources)),
+        dtype=np.int64, count=len(resources)
+    )
+    scores = np.fromiter(
+        (r["relevance_score"] for r in resources), dtype=np.float64, count=len(resources)
+    )
+    top = _dedup_topk(ids, scores, len(codes), min_relevance * 100, top_k)
+    return [resources[i] for i in top]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _dedup_topk(ids, scores, n_ids, min_score, top_k):
+        """Indices of first-seen ids scoring >= min_score, best top_k first"""
+        seen = np.zeros(n_ids, dtype=np.bool_)
+        keep = np.empty(ids.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(ids.shape[0]):
+            code = ids[i]
+            if code < 0 or seen[code]:
+                continue
+            seen[code] = True
+            if scores[i] >= min_score:
+                keep[n] = i
+                n += 1
+        keep = keep[:n]
+        # mergesort is stable, so ties keep input order like sorted()
+        order = np.argsort(-scores[keep], kind="mergesort")
+        return keep[order[:top_k]]
+else:
+    _dedup_topk = None
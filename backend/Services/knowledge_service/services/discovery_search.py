@@ -1,64 +1,75 @@
 """Qdrant search operations for discovery service"""
 
-from typing import List, Dict
+from typing import List, Dict, Any
 import logging
 from ..models import KnowledgeResource
 
 logger = logging.getLogger(__name__)
 
+# Payload keys promoted to resource fields, never copied into resource_metadata
+_EXCLUDED_METADATA_KEYS = frozenset({"title", "url", "file_path", "source", "id", "content"})
+
+# Raw document bodies are never used by discovery, so Qdrant drops them before transfer
+_SERVER_EXCLUDED_PAYLOAD = ["content"]
+
 
 def search_collection(
     qdrant_client,
-    embedder,
     collection: str,
-    terms: List[str],
+    term_vectors: Dict[str, Any],
     top_k: int,
     resource_type: str
 ) -> List[Dict]:
-    """Search Qdrant collection using SentenceTransformer embeddings (384-dim)"""
+    """Search Qdrant collection with precomputed term embeddings (384-dim)
+
+    ``term_vectors`` maps each key term to its vector, embedded once per
+    discovery request and shared by every collection search.
+    """
     if not qdrant_client:
         raise RuntimeError(f"✗ Qdrant client not available for collection '{collection}'")
-    if not embedder:
-        raise RuntimeError("✗ Text embedder not available for generating search vectors")
 
     results = []
     seen = set()
+    type_title = resource_type.title()
 
-    for term in terms:
+    for term, vector in term_vectors.items():
         try:
-            vector = embedder.embed(term)
             logger.debug(f"Searching '{collection}' for: {term}")
             
-            hits = qdrant_client.search(
+            hits = qdrant_client.search_points(
                 collection_name=collection,
                 vector=vector,
                 limit=top_k,
-                score_threshold=0.1
+                score_threshold=0.1,
+                exclude_payload=_SERVER_EXCLUDED_PAYLOAD
             )
 
             logger.debug(f"Got {len(hits)} hits in '{collection}' for '{term}'")
 
             for hit in hits:
-                payload = hit.get("metadata", {})
-                record_id = hit.get("id")
-                score = hit.get("score", 0.0)
-                
-                if not record_id or record_id in seen:
+                if hit.id is None:
+                    continue
+                record_id = str(hit.id)
+                if record_id in seen:
                     continue
                 seen.add(record_id)
+                payload = hit.payload or {}
+                payload_get = payload.get
+                title = payload_get("title")
+                if title is None:
+                    title = f"{type_title} {record_id[:8]}"
 
                 results.append({
                     "resource_type": resource_type,
-                    "source": payload.get("source", "qdrant"),
+                    "source": payload_get("source", "qdrant"),
                     "external_id": record_id,
-                    "title": payload.get("title", f"{resource_type.title()} {record_id[:8]}"),
-                    "url": payload.get("url", payload.get("file_path", "")),
-                    "relevance_score": score * 100,
+                    "title": title,
+                    "url": payload_get("url", payload_get("file_path", "")),
+                    "relevance_score": hit.score * 100,
                     "matching_keywords": [term],
-                    "explanation": f"Found {resource_type} with relevance {score*100:.1f}%",
                     "resource_metadata": {
                         k: v for k, v in payload.items()
-                        if k not in ["title", "url", "file_path", "source", "id", "content"]
+                        if k not in _EXCLUDED_METADATA_KEYS
                     }
                 })
 
@@ -67,6 +78,14 @@ def search_collection(
             continue
 
     if not results:
-        logger.warning(f"⚠ No results found in '{collection}' for {len(terms)} search terms")
+        logger.warning(f"⚠ No results found in '{collection}' for {len(term_vectors)} search terms")
 
     return results
+
+
+def build_explanation(resource: Dict) -> str:
+    """Explanation text for a discovered resource
+
+    Built only for resources that survive dedup and ranking.
+    """
+    return f"Found {resource['resource_type']} with relevance {resource['relevance_score']:.1f}%"
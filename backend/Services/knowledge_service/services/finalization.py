@@ -1,9 +1,11 @@
 """Knowledge base finalization service"""
 
-from typing import Dict
+from typing import Dict, Iterator
 from datetime import datetime
 
-from ..models import KnowledgeBase
+from sqlalchemy.orm import selectinload
+
+from ..models import KnowledgeBase, KnowledgeResource
 from .base import BaseKnowledgeService
 
 
@@ -12,9 +14,7 @@ class FinalizationService(BaseKnowledgeService):
 
     def finalize(self, kb_id: str) -> bool:
         """Mark knowledge base as ready for graph construction"""
-        kb = self.db.query(KnowledgeBase).filter_by(id=kb_id).first()
-        if not kb:
-            raise ValueError(f"Knowledge base {kb_id} not found")
+        kb = self._get_kb(kb_id)
 
         kb.status = "active"
         kb.updated_at = datetime.utcnow()
@@ -23,37 +23,46 @@ class FinalizationService(BaseKnowledgeService):
         return True
 
     def export_for_graph(self, kb_id: str) -> Dict:
-        """Export validated KB for graph construction service"""
-        kb = self.db.query(KnowledgeBase).filter_by(id=kb_id).first()
-        if not kb:
-            raise ValueError(f"Knowledge base {kb_id} not found")
+        """Export validated KB for graph construction service
 
-        resources = [r for r in kb.resources if r.included]
+        ``resources`` is a generator yielding one resource dict at a time,
+        so callers can stream large knowledge bases without building the
+        whole nested payload in memory.
+        """
+        kb = self._get_kb(
+            kb_id,
+            options=[selectinload(KnowledgeBase.resources).selectinload(KnowledgeResource.annotations)]
+        )
 
         return {
             "knowledge_base_id": kb.id,
             "project_id": kb.project_id,
-            "exported_at": datetime.utcnow().isoformat(),
-            "total_resources": len(resources),
-            "resources": [
-                {
-                    "id": r.id,
-                    "type": r.resource_type,
-                    "source": r.source,
-                    "external_id": r.external_id,
-                    "title": r.title,
-                    "url": r.url,
-                    "relevance_score": r.relevance_score,
-                    "metadata": r.resource_metadata,
-                    "annotations": [
-                        {
-                            "comment": a.comment,
-                            "tags": a.tags,
-                            "confidence": a.confidence_score
-                        }
-                        for a in r.annotations
-                    ]
-                }
-                for r in resources
-            ]
+            "exported_at": datetime.utcnow(),
+            "total_resources": sum(1 for r in kb.resources if r.included),
+            "resources": self._iter_resources(kb)
         }
+
+    @staticmethod
+    def _iter_resources(kb) -> Iterator[Dict]:
+        """Yield included resources of a KB in export format"""
+        for r in kb.resources:
+            if not r.included:
+                continue
+            yield {
+                "id": r.id,
+                "type": r.resource_type,
+                "source": r.source,
+                "external_id": r.external_id,
+                "title": r.title,
+                "url": r.url,
+                "relevance_score": r.relevance_score,
+                "metadata": r.resource_metadata,
+                "annotations": [
+                    {
+                        "comment": a.comment,
+                        "tags": a.tags,
+                        "confidence": a.confidence_score
+                    }
+                    for a in r.annotations
+                ]
+            }
@@ -2,7 +2,7 @@
 
 from typing import Dict
 
-from ..models import KnowledgeBase, ResourceAnnotation
+from ..models import ResourceAnnotation
 from .base import BaseKnowledgeService
 
 
@@ -10,10 +10,12 @@ class RetrievalService(BaseKnowledgeService):
     """Retrieve and format knowledge bases"""
 
     def get_knowledge_base(self, kb_id: str) -> Dict:
-        """Get full knowledge base with resources and annotations"""
-        kb = self.db.query(KnowledgeBase).filter_by(id=kb_id).first()
-        if not kb:
-            raise ValueError(f"Knowledge base {kb_id} not found")
+        """Get full knowledge base with resources and annotations
+
+        Timestamps are returned as ``datetime`` objects; the route
+        serializes them with orjson.
+        """
+        kb = self._get_kb(kb_id)
 
         resources_data = [self._format_resource(r) for r in kb.resources if r.included]
 
@@ -23,8 +25,8 @@ class RetrievalService(BaseKnowledgeService):
             "status": kb.status,
             "total_resources": len(resources_data),
             "total_annotations": kb.total_annotations,
-            "created_at": kb.created_at.isoformat(),
-            "updated_at": kb.updated_at.isoformat(),
+            "created_at": kb.created_at,
+            "updated_at": kb.updated_at,
             "resources": resources_data
         }
 
@@ -55,5 +57,5 @@ class RetrievalService(BaseKnowledgeService):
             "tags": ann.tags or [],
             "confidence_score": ann.confidence_score,
             "created_by": ann.created_by,
-            "created_at": ann.created_at.isoformat()
+            "created_at": ann.created_at
         }
@@ -4,21 +4,63 @@ Test script for QDesign Knowledge Service API endpoints
 Tests all discovery, retrieval, curation, and finalization endpoints
 """
 
-import requests
-import json
+import httpx
+import io
+import orjson
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TextIO, Tuple
 
 # Add services to path
-services_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(services_dir))
+services_dir = Path(__file__).resolve().parent.parent
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
 
 # Configuration
 API_ROOT_URL = "http://127.0.0.1:8000"
 API_BASE_URL = f"{API_ROOT_URL}/api/v1/knowledge"
 TIMEOUT = 30
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive client for every request in the suite. HTTP/2 needs the
+# optional h2 package and a server that speaks it; otherwise httpx stays
+# on HTTP/1.1 keep-alive.
+CLIENT = httpx.Client(
+    http2=find_spec("h2") is not None,
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    headers={"Accept": "application/json"}
+)
+
+# Failed responses are only read this far, however large the error page
+ERROR_BODY_LIMIT = 256
+
+def send(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a request through CLIENT without buffering failed bodies
+
+    Successful bodies are read in full, which also returns the connection
+    to the pool; error bodies are left for error_preview().
+    """
+    response = CLIENT.send(CLIENT.build_request(method, url, **kwargs), stream=True)
+    if response.is_success:
+        response.read()
+    return response
+
+def error_preview(response: httpx.Response) -> str:
+    """Read at most ERROR_BODY_LIMIT bytes of an error body, then close it"""
+    try:
+        for chunk in response.iter_bytes(chunk_size=ERROR_BODY_LIMIT):
+            return chunk[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+        return ""
+    finally:
+        response.close()
+
 class Colors:
     """ANSI color codes for output"""
     GREEN = '\033[92m'
@@ -28,46 +70,101 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
-def print_header(text):
+_HEADER_LINE = "=" * 60
+
+_BANNER = (
+    f"\n{Colors.BOLD}{Colors.BLUE}\n"
+    "╔════════════════════════════════════════════════════════════╗\n"
+    "║       QDesign Knowledge Service - API Test Suite          ║\n"
+    "╚════════════════════════════════════════════════════════════╝\n"
+    f"{Colors.RESET}\n"
+)
+
+def print_header(text: str) -> None:
     """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}")
-    print(f"{text.center(60)}")
-    print(f"{'='*60}{Colors.RESET}\n")
+    sys.stdout.write(f"\n{Colors.BOLD}{Colors.BLUE}{_HEADER_LINE}\n{text.center(60)}\n{_HEADER_LINE}{Colors.RESET}\n\n")
 
-def print_success(text):
+def print_success(text: str) -> None:
     """Print a success message"""
     print(f"{Colors.GREEN}✓ {text}{Colors.RESET}")
 
-def print_error(text):
+def print_error(text: str) -> None:
     """Print an error message"""
     print(f"{Colors.RED}✗ {text}{Colors.RESET}")
 
-def print_info(text):
+def print_info(text: str) -> None:
     """Print an info message"""
     print(f"{Colors.YELLOW}ℹ {text}{Colors.RESET}")
 
-def print_json(data, indent=2):
+def print_json(data: Any) -> None:
     """Print JSON data nicely"""
-    print(json.dumps(data, indent=indent))
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+
+def wait_until_ready(client: httpx.Client, url: str, timeout: float = 10.0) -> bool:
+    """Poll url with exponential backoff until it answers 200 or timeout expires"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            if client.get(url, timeout=1).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+class ThreadBufferedStdout:
+    """sys.stdout proxy that gives each capturing thread its own buffer
+
+    Tests run through capture() accumulate output in memory, so each one
+    reaches the real stream in a single write, never interleaved.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self.stream).write(text)
 
-def test_health_check():
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def capture(self, func: Callable[[], Any]) -> Tuple[str, Any, Optional[Exception]]:
+        """Run func, returning (output, result, exception)"""
+        buf = self._local.buf = io.StringIO()
+        try:
+            result, error = func(), None
+        except Exception as e:
+            result, error = False, e
+        finally:
+            self._local.buf = None
+        return buf.getvalue(), result, error
+
+def test_health_check() -> bool:
     """Test the health check endpoint"""
     print_header("Health Check")
     try:
-        response = requests.get(f"{API_ROOT_URL}/health", timeout=TIMEOUT)
+        response = send("GET", f"{API_ROOT_URL}/health")
         if response.status_code == 200:
             print_success("API is healthy")
-            print_json(response.json())
+            print_json(orjson.loads(response.content))
             return True
         else:
             print_error(f"Health check failed with status {response.status_code}")
+            # Also closes the streamed response, returning its connection
+            preview = error_preview(response)
+            if preview:
+                print(f"Response: {preview}")
             return False
     except Exception as e:
         print_error(f"Failed to connect to API: {e}")
         return False
 
-def test_discovery_endpoints():
-    """Test discovery endpoints"""
+def test_discovery_endpoints() -> Tuple[bool, Optional[str]]:
+    """Test discovery endpoints, returning (success, knowledge base id)"""
     print_header("Discovery Service Endpoints")
     
     # Test data
@@ -91,6 +188,7 @@ def test_discovery_endpoints():
     ]
     
     all_ok = True
+    kb_id = None
     for endpoint in endpoints:
         try:
             print(f"\n{Colors.BOLD}Testing: {endpoint['name']}{Colors.RESET}")
@@ -99,18 +197,19 @@ def test_discovery_endpoints():
             url = f"{API_BASE_URL}{endpoint['path']}"
             
             if endpoint['method'] == "POST":
-                response = requests.post(url, json=endpoint['data'], timeout=TIMEOUT)
+                response = send("POST", url, content=orjson.dumps(endpoint['data']), headers=JSON_HEADERS)
             else:
-                response = requests.get(url, params=endpoint['data'], timeout=TIMEOUT)
+                response = send("GET", url, params=endpoint['data'])
             
             print(f"Status Code: {response.status_code}")
             
             if response.status_code in [200, 201]:
                 print_success(f"{endpoint['name']} successful")
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Show summary based on response type
                 if isinstance(data, dict):
+                    kb_id = data.get("knowledge_base_id") or kb_id
                     if "total_resources" in data:
                         print_info(f"Found {data.get('total_resources', 0)} resources")
                     elif "knowledge_base_id" in data:
@@ -122,15 +221,15 @@ def test_discovery_endpoints():
                 
             else:
                 print_error(f"Failed with status {response.status_code}")
-                print(f"Response: {response.text[:200]}")
+                print(f"Response: {error_preview(response)}")
                 all_ok = False
         except Exception as e:
             print_error(f"Exception: {e}")
             all_ok = False
 
-    return all_ok
+    return all_ok, kb_id
 
-def test_curation_endpoints(kb_id: str) -> bool:
+def test_curation_endpoints(kb_id: Optional[str]) -> bool:
     """Test curation endpoints"""
     print_header("Curation Service Endpoints")
     if not kb_id:
@@ -149,10 +248,11 @@ def test_curation_endpoints(kb_id: str) -> bool:
             "comment": "Seed paper for testing"
         }
 
-        response = requests.post(
+        response = send(
+            "POST",
             f"{API_BASE_URL}/resources/custom",
-            json=resource_data,
-            timeout=TIMEOUT
+            content=orjson.dumps(resource_data),
+            headers=JSON_HEADERS
         )
 
         print(f"Status Code: {response.status_code}")
@@ -160,47 +260,60 @@ def test_curation_endpoints(kb_id: str) -> bool:
         resource_id = None
         if response.status_code in [200, 201]:
             print_success("Custom resource added")
-            data = response.json()
+            data = orjson.loads(response.content)
             resource_id = data.get("id")
         else:
             print_error(f"Failed with status {response.status_code}")
-            print(f"Response: {response.text[:200]}")
+            print(f"Response: {error_preview(response)}")
             return False
 
-        if resource_id:
-            print(f"\n{Colors.BOLD}Testing: Annotate Resource{Colors.RESET}")
-            annotate_data = {
-                "comment": "Looks relevant for stability optimization",
-                "tags": ["stability", "antibody"],
-                "confidence_score": 0.8
-            }
-            response = requests.post(
-                f"{API_BASE_URL}/resources/{resource_id}/annotate",
-                json=annotate_data,
-                timeout=TIMEOUT
+        annotate_data = {
+            "comment": "Looks relevant for stability optimization",
+            "tags": ["stability", "antibody"],
+            "confidence_score": 0.8
+        }
+        reorder_data = {
+            "resource_ids": [resource_id] if resource_id else []
+        }
+
+        # Annotate and reorder only depend on resource_id, not on each
+        # other, so both round-trips overlap
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            annotate_future = None
+            if resource_id:
+                annotate_future = pool.submit(
+                    send,
+                    "POST",
+                    f"{API_BASE_URL}/resources/{resource_id}/annotate",
+                    content=orjson.dumps(annotate_data),
+                    headers=JSON_HEADERS
+                )
+            reorder_future = pool.submit(
+                send,
+                "POST",
+                f"{API_BASE_URL}/{kb_id}/reorder",
+                content=orjson.dumps(reorder_data),
+                headers=JSON_HEADERS
             )
+
+        if annotate_future is not None:
+            print(f"\n{Colors.BOLD}Testing: Annotate Resource{Colors.RESET}")
+            response = annotate_future.result()
             print(f"Status Code: {response.status_code}")
             if response.status_code in [200, 201]:
                 print_success("Annotation added")
             else:
                 print_error(f"Failed with status {response.status_code}")
-                print(f"Response: {response.text[:200]}")
+                print(f"Response: {error_preview(response)}")
 
         print(f"\n{Colors.BOLD}Testing: Reorder Resources{Colors.RESET}")
-        reorder_data = {
-            "resource_ids": [resource_id] if resource_id else []
-        }
-        response = requests.post(
-            f"{API_BASE_URL}/{kb_id}/reorder",
-            json=reorder_data,
-            timeout=TIMEOUT
-        )
+        response = reorder_future.result()
         print(f"Status Code: {response.status_code}")
         if response.status_code in [200, 201]:
             print_success("Reordered resources")
         else:
             print_error(f"Failed with status {response.status_code}")
-            print(f"Response: {response.text[:200]}")
+            print(f"Response: {error_preview(response)}")
             return False
 
         return True
@@ -209,7 +322,7 @@ def test_curation_endpoints(kb_id: str) -> bool:
         print_error(f"Exception: {e}")
         return False
 
-def test_retrieval_endpoints(kb_id: str) -> bool:
+def test_retrieval_endpoints(kb_id: Optional[str]) -> bool:
     """Test retrieval endpoints"""
     print_header("Retrieval Service Endpoints")
     if not kb_id:
@@ -219,30 +332,30 @@ def test_retrieval_endpoints(kb_id: str) -> bool:
     try:
         print(f"{Colors.BOLD}Testing: Get Knowledge Base{Colors.RESET}")
 
-        response = requests.get(
-            f"{API_BASE_URL}/{kb_id}",
-            timeout=TIMEOUT
+        response = send(
+            "GET",
+            f"{API_BASE_URL}/{kb_id}"
         )
 
         print(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
             print_success("Knowledge base retrieved")
-            kb = response.json()
+            kb = orjson.loads(response.content)
             if isinstance(kb, dict):
                 resources = kb.get("resources", []) if isinstance(kb.get("resources"), list) else []
                 print_info(f"Resources: {len(resources)}")
             return True
         else:
             print_error(f"Failed with status {response.status_code}")
-            print(f"Response: {response.text[:200]}")
+            print(f"Response: {error_preview(response)}")
             return False
 
     except Exception as e:
         print_error(f"Exception: {e}")
         return False
 
-def test_finalization_endpoints(kb_id: str) -> bool:
+def test_finalization_endpoints(kb_id: Optional[str]) -> bool:
     """Test finalization endpoints"""
     print_header("Finalization Service Endpoints")
     if not kb_id:
@@ -252,9 +365,9 @@ def test_finalization_endpoints(kb_id: str) -> bool:
     try:
         print(f"{Colors.BOLD}Testing: Finalize Knowledge Base{Colors.RESET}")
 
-        response = requests.post(
-            f"{API_BASE_URL}/{kb_id}/finalize",
-            timeout=TIMEOUT
+        response = send(
+            "POST",
+            f"{API_BASE_URL}/{kb_id}/finalize"
         )
 
         print(f"Status Code: {response.status_code}")
@@ -263,22 +376,24 @@ def test_finalization_endpoints(kb_id: str) -> bool:
             print_success("Knowledge base finalized")
         else:
             print_error(f"Failed with status {response.status_code}")
-            if response.text:
-                print(f"Response: {response.text[:200]}")
+            preview = error_preview(response)
+            if preview:
+                print(f"Response: {preview}")
             return False
 
         print(f"\n{Colors.BOLD}Testing: Export Knowledge Base{Colors.RESET}")
-        response = requests.get(
-            f"{API_BASE_URL}/{kb_id}/export",
-            timeout=TIMEOUT
+        response = send(
+            "GET",
+            f"{API_BASE_URL}/{kb_id}/export"
         )
         print(f"Status Code: {response.status_code}")
         if response.status_code == 200:
             print_success("Knowledge base exported")
         else:
             print_error(f"Failed with status {response.status_code}")
-            if response.text:
-                print(f"Response: {response.text[:200]}")
+            preview = error_preview(response)
+            if preview:
+                print(f"Response: {preview}")
             return False
 
         return True
@@ -287,34 +402,38 @@ def test_finalization_endpoints(kb_id: str) -> bool:
         print_error(f"Exception: {e}")
         return False
 
-def test_embedder_availability():
-    """Test that embedders are properly initialized"""
+def test_embedder_availability() -> bool:
+    """Test that embedders are properly initialized
+
+    Passes when the text embedder works; CLIP and ESM are optional and
+    only reported.
+    """
     print_header("Embedder Availability Check")
     
     try:
-        # Try to import embedders
-        from pipeline.embedding import (
-            SentenceTransformerTextEmbedder,
-            CLIPImageEmbedder,
-            ESMSequenceEmbedder
+        from knowledge_service.utils._embedder_cache import (
+            probe_text_embedder,
+            get_image_embedder,
+            get_sequence_embedder
         )
         
         # Test text embedder
         print(f"\n{Colors.BOLD}Testing: SentenceTransformer Text Embedder{Colors.RESET}")
         try:
-            text_embedder = SentenceTransformerTextEmbedder()
-            embedding = text_embedder.embed("test protein sequence")
-            if embedding is not None and len(embedding) == 384:
+            _, embedding = probe_text_embedder()
+            text_ok = embedding is not None and len(embedding) == 384
+            if text_ok:
                 print_success(f"SentenceTransformer embedder working (384-dim)")
             else:
                 print_error("SentenceTransformer returned invalid embedding")
         except Exception as e:
             print_error(f"SentenceTransformer failed: {e}")
+            text_ok = False
         
         # Test image embedder
         print(f"\n{Colors.BOLD}Testing: CLIP Image Embedder{Colors.RESET}")
         try:
-            image_embedder = CLIPImageEmbedder()
+            get_image_embedder()
             # Don't test with actual image, just check initialization
             print_success(f"CLIP embedder initialized (512-dim)")
         except Exception as e:
@@ -323,96 +442,76 @@ def test_embedder_availability():
         # Test sequence embedder
         print(f"\n{Colors.BOLD}Testing: ESM Sequence Embedder{Colors.RESET}")
         try:
-            seq_embedder = ESMSequenceEmbedder()
+            get_sequence_embedder()
             # Don't test with actual sequence, just check initialization
             print_success(f"ESM embedder initialized (1280-dim)")
         except Exception as e:
             print_info(f"ESM may not be installed: {e}")
+        
+        return text_ok
             
     except ImportError as e:
         print_error(f"Failed to import embedders: {e}")
+        return False
 
-def main():
+def main() -> int:
     """Run all tests"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}")
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║       QDesign Knowledge Service - API Test Suite          ║")
-    print("╚════════════════════════════════════════════════════════════╝")
-    print(Colors.RESET)
+    sys.stdout.write(_BANNER)
     
     print_info(f"Testing API at: {API_BASE_URL}")
     print_info(f"Timeout: {TIMEOUT} seconds\n")
     
-    # Wait a moment for API to be ready
-    time.sleep(1)
-    
-    # Run tests
-    results = {}
-    try:
-        results["Health Check"] = test_health_check()
-    except Exception as e:
-        print_error(f"Test Health Check failed with exception: {e}")
-        results["Health Check"] = False
-
     try:
-        results["Embedder Availability"] = test_embedder_availability()
-    except Exception as e:
-        print_error(f"Test Embedder Availability failed with exception: {e}")
-        results["Embedder Availability"] = False
-
-    kb_id = None
-    try:
-        discovery_ok = test_discovery_endpoints()
-        results["Discovery Endpoints"] = discovery_ok
-        if discovery_ok:
-            # Re-run discovery to capture kb id for downstream tests
-            response = requests.post(
-                f"{API_BASE_URL}/discover",
-                json={
-                    "project_id": "test-project-001",
-                    "project_description": "Protein engineering for stability and affinity",
-                    "top_k": 5,
-                    "min_relevance": 0.3
-                },
-                timeout=TIMEOUT
-            )
-            if response.status_code in [200, 201]:
-                data = response.json()
-                kb_id = data.get("knowledge_base_id")
-    except Exception as e:
-        print_error(f"Test Discovery Endpoints failed with exception: {e}")
-        results["Discovery Endpoints"] = False
-
-    try:
-        results["Retrieval Endpoints"] = test_retrieval_endpoints(kb_id)
-    except Exception as e:
-        print_error(f"Test Retrieval Endpoints failed with exception: {e}")
-        results["Retrieval Endpoints"] = False
-
-    try:
-        results["Curation Endpoints"] = test_curation_endpoints(kb_id)
-    except Exception as e:
-        print_error(f"Test Curation Endpoints failed with exception: {e}")
-        results["Curation Endpoints"] = False
-
-    try:
-        results["Finalization Endpoints"] = test_finalization_endpoints(kb_id)
-    except Exception as e:
-        print_error(f"Test Finalization Endpoints failed with exception: {e}")
-        results["Finalization Endpoints"] = False
+        # Returns immediately on a warm server, waits out a cold start
+        if not wait_until_ready(CLIENT, f"{API_ROOT_URL}/health"):
+            print_info("API did not report healthy yet; running tests anyway")
     
-    # Summary
-    print_header("Test Summary")
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
+        # Run tests; each test's output is buffered and written in one go
+        results: Dict[str, Optional[bool]] = {}
+        stdout = ThreadBufferedStdout(sys.stdout)
+
+        def report(name: str, output: str, result: Optional[bool], error: Optional[Exception]) -> None:
+            stdout.stream.write(output)
+            stdout.stream.flush()
+            if error is not None:
+                print_error(f"Test {name} failed with exception: {error}")
+            results[name] = result
+
+        sys.stdout = stdout
+        try:
+            # Health check and embedder loading are independent; overlap them
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = {
+                    "Health Check": pool.submit(stdout.capture, test_health_check),
+                    "Embedder Availability": pool.submit(stdout.capture, test_embedder_availability),
+                }
+            for name, future in futures.items():
+                report(name, *future.result())
+
+            output, result, error = stdout.capture(test_discovery_endpoints)
+            discovery_ok, kb_id = result if error is None else (False, None)
+            report("Discovery Endpoints", output, discovery_ok, error)
+
+            report("Retrieval Endpoints", *stdout.capture(partial(test_retrieval_endpoints, kb_id)))
+            report("Curation Endpoints", *stdout.capture(partial(test_curation_endpoints, kb_id)))
+            report("Finalization Endpoints", *stdout.capture(partial(test_finalization_endpoints, kb_id)))
+        finally:
+            sys.stdout = stdout.stream
+
+        # Summary
+        print_header("Test Summary")
+        passed = sum(1 for v in results.values() if v)
+        total = len(results)
     
-    for test_name, result in results.items():
-        status = f"{Colors.GREEN}PASS{Colors.RESET}" if result else f"{Colors.RED}FAIL{Colors.RESET}"
-        print(f"{status} - {test_name}")
+        for test_name, ok in results.items():
+            status = f"{Colors.GREEN}PASS{Colors.RESET}" if ok else f"{Colors.RED}FAIL{Colors.RESET}"
+            print(f"{status} - {test_name}")
     
-    print(f"\n{Colors.BOLD}Total: {passed}/{total} tests passed{Colors.RESET}\n")
+        print(f"\n{Colors.BOLD}Total: {passed}/{total} tests passed{Colors.RESET}\n")
     
-    return 0 if passed == total else 1
+        return 0 if passed == total else 1
+    finally:
+        CLIENT.close()
 
 if __name__ == "__main__":
     sys.exit(main())
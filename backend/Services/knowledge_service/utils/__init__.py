@@ -1,9 +1,17 @@
 """Utility functions"""
 
-from .extractors import extract_key_terms, highlight_matches, generate_explanation
+from .extractors import (
+    extract_key_terms,
+    extract_key_terms_batch,
+    highlight_matches,
+    generate_explanation,
+    generate_explanations,
+)
 
 __all__ = [
     "extract_key_terms",
+    "extract_key_terms_batch",
     "highlight_matches",
     "generate_explanation",
+    "generate_explanations",
 ]
@@ -0,0 +1,50 @@
+"""Process-wide embedder instances
+
+Each factory loads its model on first call and returns the same instance
+afterwards, so discovery, the API test suite and validate_config never
+load the same weights twice in one interpreter.
+"""
+
+from functools import lru_cache
+
+PROBE_TEXT = "protein binding affinity"
+
+
+def _load(class_name: str):
+    """Instantiate a pipeline embedder by class name"""
+    import pipeline.embedding as embedding
+    cls = getattr(embedding, class_name)
+    if cls is None:
+        raise ImportError(f"{class_name} dependencies are not installed")
+    return cls()
+
+
+@lru_cache(maxsize=None)
+def get_text_embedder():
+    """SentenceTransformer all-MiniLM-L6-v2 text embedder (384-dim)"""
+    return _load("SentenceTransformerTextEmbedder")
+
+
+@lru_cache(maxsize=None)
+def probe_text_embedder():
+    """Text embedder plus its embedding of PROBE_TEXT, computed once"""
+    embedder = get_text_embedder()
+    return embedder, embedder.embed(PROBE_TEXT)
+
+
+@lru_cache(maxsize=None)
+def get_image_embedder():
+    """CLIP image embedder (512-dim)"""
+    return _load("CLIPImageEmbedder")
+
+
+@lru_cache(maxsize=None)
+def get_sequence_embedder():
+    """ESM-2 protein sequence embedder (1280-dim)"""
+    return _load("ESMSequenceEmbedder")
+
+
+@lru_cache(maxsize=None)
+def get_structure_embedder():
+    """PDB feature structure embedder"""
+    return _load("StructureEmbedder")
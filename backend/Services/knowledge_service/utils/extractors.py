@@ -1,8 +1,29 @@
 """Utility functions for text extraction and processing"""
 
-from typing import List
+from typing import List, Tuple, Dict, FrozenSet, Match, Pattern, Sequence
+from functools import lru_cache
 import re
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_STOPWORDS: FrozenSet[str] = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
+    "been", "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "that", "this", "these", "those", "i",
+    "you", "he", "she", "it", "we", "they", "what", "which", "who",
+})
+
+_STOPWORD_ALT = "|".join(sorted(_STOPWORDS, key=len, reverse=True))
+
+# From this many keywords on, one Aho-Corasick scan beats the regex alternation
+_AHOCORASICK_MIN_KEYWORDS = 16
+
 
 def extract_key_terms(text: str, min_length: int = 3) -> List[str]:
     """
@@ -18,32 +39,30 @@ def extract_key_terms(text: str, min_length: int = 3) -> List[str]:
     Returns:
         List of key terms
     """
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
-        "been", "being", "have", "has", "had", "do", "does", "did", "will",
-        "would", "could", "should", "that", "this", "these", "those", "i",
-        "you", "he", "she", "it", "we", "they", "what", "which", "who",
-    }
-
-    # Split and clean
-    words = re.findall(r"\b\w+\b", text.lower())
-
-    # Filter stopwords and short terms
-    filtered = [
-        w for w in words
-        if len(w) >= min_length and w not in stopwords
-    ]
-
-    # Return unique terms in order of appearance
-    seen = set()
-    result = []
-    for w in filtered:
-        if w not in seen:
-            result.append(w)
-            seen.add(w)
-
-    return result
+    # Stopword and length filtering happen inside the regex engine;
+    # dict.fromkeys keeps unique terms in order of appearance
+    return list(dict.fromkeys(_make_keyterm_re(min_length).findall(text.lower())))
+
+
+def extract_key_terms_batch(texts: List[str], min_length: int = 3) -> List[List[str]]:
+    """
+    Extract key terms from many project descriptions at once.
+
+    Args:
+        texts: Project description texts
+        min_length: Minimum word length to include
+
+    Returns:
+        One list of key terms per text, as extract_key_terms would return
+    """
+    findall = _make_keyterm_re(min_length).findall
+    return [list(dict.fromkeys(findall(text.lower()))) for text in texts]
+
+
+@lru_cache(maxsize=None)
+def _make_keyterm_re(min_length: int) -> Pattern:
+    """Compile a pattern matching whole non-stopword words of min_length+ chars"""
+    return re.compile(rf"\b(?!(?:{_STOPWORD_ALT})\b)\w{{{max(min_length, 1)},}}\b")
 
 
 def highlight_matches(text: str, keywords: List[str]) -> str:
@@ -57,11 +76,97 @@ def highlight_matches(text: str, keywords: List[str]) -> str:
     Returns:
         Text with keywords wrapped in markup
     """
-    result = text
+    terms = tuple(k for k in keywords if k)
+    if not terms:
+        return text
+    # str.lower() only agrees with re.IGNORECASE on ASCII; elsewhere (e.g.
+    # "ſ" matching "s") the regex path decides
+    if (
+        ahocorasick is not None
+        and len(terms) >= _AHOCORASICK_MIN_KEYWORDS
+        and text.isascii()
+        and all(term.isascii() for term in terms)
+    ):
+        return _highlight_ahocorasick(text, text.lower(), terms)
+    pattern, replacements = _compile_highlight(terms)
+
+    def mark(match: Match[str]) -> str:
+        index = match.lastindex
+        # Every alternative is a group, so a match always sets lastindex
+        assert index is not None
+        return f"**{replacements[index - 1]}**"
+
+    return pattern.sub(mark, text)
+
+
+@lru_cache(maxsize=256)
+def _compile_highlight(keywords: Tuple[str, ...]) -> Tuple[Pattern, List[str]]:
+    """Compile one case-insensitive alternation for a keyword set.
+
+    Each keyword is its own capture group, and the list holds the
+    keyword for each group in order, so a match maps back through
+    ``m.lastindex`` whatever case-fold variant it matched. Longer
+    keywords come first so overlapping terms prefer the longest match;
+    of keywords equal ignoring case, the first one given is used.
+    """
+    unique: Dict[str, str] = {}
     for keyword in keywords:
-        pattern = rf"\b{re.escape(keyword)}\b"
-        result = re.sub(pattern, f"**{keyword}**", result, flags=re.IGNORECASE)
-    return result
+        unique.setdefault(keyword.lower(), keyword)
+    ordered = sorted(unique.values(), key=len, reverse=True)
+    pattern = re.compile(
+        r"\b(?:" + "|".join(f"({re.escape(keyword)})" for keyword in ordered) + r")\b", re.IGNORECASE
+    )
+    return pattern, ordered
+
+
+def _highlight_ahocorasick(text: str, lowered: str, keywords: Tuple[str, ...]) -> str:
+    """Single-scan highlight with the same results as the regex path.
+
+    Hits are filtered to whole words (``\\b`` semantics), then taken
+    left to right, longest first, skipping overlaps.
+    """
+    automaton = _build_automaton(keywords)
+    hits = []
+    for end, (length, keyword) in automaton.iter(lowered):
+        start = end - length + 1
+        if _is_word_boundary(text, start) and _is_word_boundary(text, end + 1):
+            hits.append((start, -length, keyword))
+    hits.sort()
+
+    parts = []
+    pos = 0
+    for start, neg_length, keyword in hits:
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        parts.append(f"**{keyword}**")
+        pos = start - neg_length
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _build_automaton(keywords: Tuple[str, ...]):
+    """Aho-Corasick automaton over lowercased keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        key = keyword.lower()
+        if key not in automaton:
+            automaton.add_word(key, (len(key), keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_boundary(text: str, idx: int) -> bool:
+    """Whether ``\\b`` would match at text[idx]"""
+    before = idx > 0 and _is_word_char(text[idx - 1])
+    after = idx < len(text) and _is_word_char(text[idx])
+    return before != after
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char matches ``\\w``"""
+    return char.isalnum() or char == "_"
 
 
 def generate_explanation(
@@ -82,13 +187,42 @@ def generate_explanation(
     Returns:
         Human-readable explanation
     """
-    keyword_str = ", ".join(f"'{kw}'" for kw in matching_keywords[:3])
-    score_pct = int(similarity_score * 100)
-
-    explanation = (
+    keywords = matching_keywords[:3]
+    keyword_str = "'" + "', '".join(keywords) + "'" if keywords else ""
+    return (
         f"Matched keywords: {keyword_str}. "
-        f"Semantic similarity: {score_pct}%. "
+        f"Semantic similarity: {int(similarity_score * 100)}%. "
         f"Source: {source}"
     )
 
-    return explanation
+
+def generate_explanations(
+    similarity_scores: Sequence[float],
+    keyword_lists: Sequence[List[str]],
+    resource_types: Sequence[str],
+    sources: Sequence[str]
+) -> List[str]:
+    """
+    Batch form of generate_explanation for a list of resources.
+
+    Args:
+        similarity_scores: Semantic similarities (0-1), one per resource
+        keyword_lists: Matched keywords per resource
+        resource_types: Type of each resource
+        sources: Source of each resource
+
+    Returns:
+        One explanation per resource, identical to generate_explanation
+    """
+    # Truncating cast, same as int() on each score
+    score_pcts = (np.asarray(similarity_scores, dtype=np.float64) * 100).astype(np.int64).tolist()
+    explanations = []
+    for score_pct, keywords, source in zip(score_pcts, keyword_lists, sources):
+        keywords = keywords[:3]
+        keyword_str = "'" + "', '".join(keywords) + "'" if keywords else ""
+        explanations.append(
+            f"Matched keywords: {keyword_str}. "
+            f"Semantic similarity: {score_pct}%. "
+            f"Source: {source}"
+        )
+    return explanations
@@ -5,11 +5,13 @@ Checks that all components are properly configured and compatible
 """
 
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add services to path
-services_dir = Path(__file__).parent / "backend" / "Services"
-sys.path.insert(0, str(services_dir))
+services_dir = Path(__file__).resolve().parent.parent
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
 
 def print_section(title):
     """Print a section header"""
@@ -18,7 +20,11 @@ def print_section(title):
     print(f"{'='*60}\n")
 
 def check_imports():
-    """Check that all required packages are installed"""
+    """Check that all required packages are installed
+
+    Uses find_spec so packages are located without executing them
+    (importing torch or sentence_transformers alone takes seconds).
+    """
     print_section("Checking Imports")
     
     packages = {
@@ -40,7 +46,8 @@ def check_imports():
     print("Required packages:")
     for package, pip_name in packages.items():
         try:
-            __import__(package)
+            if find_spec(package) is None:
+                raise ImportError(package)
             print(f"  ✓ {package} ({pip_name})")
         except ImportError:
             print(f"  ✗ {package} ({pip_name}) - MISSING")
@@ -49,7 +56,8 @@ def check_imports():
     print("\nOptional packages:")
     for package, pip_name in optional_packages.items():
         try:
-            __import__(package)
+            if find_spec(package) is None:
+                raise ImportError(package)
             print(f"  ✓ {package} ({pip_name})")
         except ImportError:
             print(f"  ⚠ {package} ({pip_name}) - NOT installed")
@@ -93,23 +101,21 @@ def check_embedders():
     print_section("Checking Embedders")
     
     try:
-        from pipeline.embedding import (
-            SentenceTransformerTextEmbedder,
-            CLIPImageEmbedder,
-            ESMSequenceEmbedder,
-            StructureEmbedder
+        from knowledge_service.utils._embedder_cache import (
+            probe_text_embedder,
+            get_image_embedder,
+            get_sequence_embedder,
+            get_structure_embedder
         )
         
         # Check text embedder
         print("Text Embedder (SentenceTransformer):")
         try:
-            text_embedder = SentenceTransformerTextEmbedder()
+            text_embedder, embedding = probe_text_embedder()
             dim = text_embedder.get_dimension()
             print(f"  ✓ Initialized - {dim}-dim")
             
-            # Test embedding
-            test_text = "protein binding affinity"
-            embedding = text_embedder.embed(test_text)
+            # Test embedding (shared with the API test suite's probe)
             if embedding is not None and len(embedding) == dim:
                 print(f"  ✓ Test embedding successful")
             else:
@@ -122,7 +128,7 @@ def check_embedders():
         # Check image embedder
         print("\nImage Embedder (CLIP):")
         try:
-            image_embedder = CLIPImageEmbedder()
+            image_embedder = get_image_embedder()
             dim = image_embedder.get_dimension()
             print(f"  ✓ Initialized - {dim}-dim")
         except Exception as e:
@@ -131,7 +137,7 @@ def check_embedders():
         # Check sequence embedder
         print("\nSequence Embedder (ESM-2):")
         try:
-            seq_embedder = ESMSequenceEmbedder()
+            seq_embedder = get_sequence_embedder()
             dim = seq_embedder.get_dimension()
             print(f"  ✓ Initialized - {dim}-dim")
         except Exception as e:
@@ -140,7 +146,7 @@ def check_embedders():
         # Check structure embedder
         print("\nStructure Embedder (PDB Features):")
         try:
-            struct_embedder = StructureEmbedder()
+            struct_embedder = get_structure_embedder()
             dim = struct_embedder.get_dimension()
             print(f"  ✓ Initialized - {dim}-dim")
         except Exception as e: